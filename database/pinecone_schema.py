@@ -4,9 +4,13 @@
 import os
 import sys
 import time
+import random
 import hashlib
 import logging
+import traceback
 from datetime import datetime
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List
 from pinecone import Pinecone, ServerlessSpec
 from dotenv import load_dotenv
 
@@ -23,6 +27,18 @@ DIMENSION = 512
 METRIC = "cosine"
 CLOUD = "aws"
 REGION = "us-east-1"
+HEADER_RULE = "=" * 70
+UPSERT_BATCH_SIZE = 100
+UPSERT_POOL_THREADS = 30
+INDEX_READY_TIMEOUT = 60.0
+INDEX_READY_POLL_INTERVAL = 0.5
+INDEX_READY_MAX_POLL_INTERVAL = 2.0
+
+
+def _chunks(vectors: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    it = iter(vectors)
+    while chunk := list(islice(it, size)):
+        yield chunk
 
 
 class PineconeSchemaManager:
@@ -38,17 +54,51 @@ class PineconeSchemaManager:
     
     @staticmethod
     def print_header(title: str):
-        logger.info("=" * 70)
+        logger.info(HEADER_RULE)
         logger.info(f"  {title}")
-        logger.info("=" * 70)
+        logger.info(HEADER_RULE)
+    
+    def index_exists(self) -> bool:
+        if hasattr(self.pc, "has_index"):
+            return self.pc.has_index(self.index_name)
+        return any(idx.name == self.index_name for idx in self.pc.list_indexes())
+    
+    def wait_until_ready(
+        self,
+        timeout: float = INDEX_READY_TIMEOUT,
+        interval: float = INDEX_READY_POLL_INTERVAL
+    ) -> bool:
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.pc.describe_index(self.index_name).status['ready']:
+                return True
+            if time.monotonic() >= deadline:
+                logger.warning(f"Index not ready after {timeout:.0f}s")
+                return False
+            time.sleep(interval)
+            interval = min(interval * 1.5, INDEX_READY_MAX_POLL_INTERVAL)
+    
+    def bulk_upsert(
+        self,
+        vectors: Iterable[Dict],
+        batch_size: int = UPSERT_BATCH_SIZE,
+        pool_threads: int = UPSERT_POOL_THREADS
+    ) -> int:
+        with self.pc.Index(self.index_name, pool_threads=pool_threads) as index:
+            async_results = [
+                index.upsert(vectors=chunk, async_req=True)
+                for chunk in _chunks(vectors, batch_size)
+            ]
+            upserted = sum(result.get().upserted_count for result in async_results)
+        
+        logger.info(f"Upserted {upserted} vectors in {len(async_results)} batches")
+        return upserted
     
     def setup_pinecone_schema(self, insert_sample_data: bool = True) -> bool:
         self.print_header("Setup Pinecone Schema")
         
         try:
-            existing_indexes = [idx.name for idx in self.pc.list_indexes()]
-            
-            if self.index_name not in existing_indexes:
+            if not self.index_exists():
                 logger.info("Creating new index...")
                 logger.info(f"Dimension: {DIMENSION}, Metric: {METRIC}")
                 
@@ -60,7 +110,9 @@ class PineconeSchemaManager:
                 )
                 
                 logger.info("Index created")
-                time.sleep(10)
+                if not self.wait_until_ready():
+                    logger.error(f"Index '{self.index_name}' did not become ready - aborting setup")
+                    return False
             else:
                 logger.info("Index already exists - Skipping")
                 index = self.pc.Index(self.index_name)
@@ -127,7 +179,6 @@ class PineconeSchemaManager:
                 vectors_to_upsert = []
                 
                 for idx, place in enumerate(sample_places, 1):
-                    import random
                     random.seed(idx)
                     dummy_vector = [random.uniform(-1, 1) for _ in range(DIMENSION)]
                     
@@ -155,7 +206,7 @@ class PineconeSchemaManager:
                     logger.info(f"[{idx}/{len(sample_places)}] {place['place_name']}")
                 
                 logger.info("Upserting vectors...")
-                index.upsert(vectors=vectors_to_upsert)
+                self.bulk_upsert(vectors_to_upsert)
                 logger.info("Sample data inserted")
                 
                 time.sleep(2)
@@ -168,7 +219,6 @@ class PineconeSchemaManager:
             stats = index.describe_index_stats()
             logger.info(f"Dimension: {stats.get('dimension')}, Vectors: {stats.get('total_vector_count', 0)}")
             
-            import random
             random.seed(42)
             query_vector = [random.uniform(-1, 1) for _ in range(DIMENSION)]
             results = index.query(vector=query_vector, top_k=3, include_metadata=True)
@@ -185,7 +235,6 @@ class PineconeSchemaManager:
         
         except Exception as e:
             logger.error(f"Setup error: {e}")
-            import traceback
             traceback.print_exc()
             return False
 
@@ -213,7 +262,6 @@ def main():
     
     except Exception as e:
         logger.error(f"Fatal error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -602,14 +602,14 @@ async def quest_vlm_chat(request: QuestVLMChatRequest, user_id: str = Depends(ge
             quality=85
         )
         
-        from services.vlm import analyze_place_image, extract_place_info_from_vlm_response, calculate_confidence_score
+        from services.vlm import analyze_place_image_async, extract_place_info_from_vlm_response, calculate_confidence_score
         from services.db import search_places_by_radius, get_place_by_name, save_vlm_log
         from services.embedding import generate_image_embedding, hash_image
         from services.optimized_search import search_with_gps_filter
         
         nearby_places = []
         
-        vlm_response = analyze_place_image(
+        vlm_response = await analyze_place_image_async(
             image_bytes=image_bytes,
             nearby_places=nearby_places,
             language="en",
@@ -1125,13 +1125,13 @@ async def recommend_route(request: RouteRecommendRequest, user_id: str = Depends
         if request.image:
             try:
                 import base64
-                from services.vlm import analyze_place_image, extract_place_info_from_vlm_response
+                from services.vlm import analyze_place_image_async, extract_place_info_from_vlm_response
                 from services.quest_rag import search_quests_by_rag_text
                 from services.embedding import generate_text_embedding
                 
                 image_bytes = base64.b64decode(request.image)
                 
-                vlm_response = analyze_place_image(
+                vlm_response = await analyze_place_image_async(
                     image_bytes=image_bytes,
                     nearby_places=[],
                     language="en",
@@ -9,7 +9,7 @@ import logging
 from io import BytesIO
 
 from services.vlm import (
-    analyze_place_image,
+    analyze_place_image_async,
     extract_place_info_from_vlm_response,
     calculate_confidence_score
 )
@@ -52,15 +52,24 @@ class SimilarImageRequest(BaseModel):
 async def analyze_image(request: VLMAnalyzeRequest, user_id: str = Depends(get_current_user_id)):
     start_time = time.time()
     
+    try:
+        image_bytes = base64.b64decode(request.image)
+        logger.info(f"Image decoded: {len(image_bytes)} bytes")
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid base64 image: {str(e)}")
+    
+    return await _analyze_image_bytes(image_bytes, request, user_id, start_time)
+
+
+async def _analyze_image_bytes(
+    image_bytes: bytes,
+    request: VLMAnalyzeRequest,
+    user_id: str,
+    start_time: float
+):
     try:
         logger.info(f"VLM analysis: user={user_id}, GPS=({request.latitude}, {request.longitude})")
         
-        try:
-            image_bytes = base64.b64decode(request.image)
-            logger.info(f"Image decoded: {len(image_bytes)} bytes")
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Invalid base64 image: {str(e)}")
-        
         image_hash = hash_image(image_bytes)
         logger.info(f"Image hash: {image_hash[:16]}...")
         
@@ -136,7 +145,7 @@ async def analyze_image(request: VLMAnalyzeRequest, user_id: str = Depends(get_c
             except Exception as e:
                 logger.warning(f"Failed to load quest context: {e}")
         
-        vlm_response = analyze_place_image(
+        vlm_response = await analyze_place_image_async(
             image_bytes=image_bytes,
             nearby_places=enhanced_nearby_places,
             language="en",
@@ -350,12 +359,14 @@ async def analyze_image_multipart(
     enable_tts: bool = Form(True),
     user_id: str = Depends(get_current_user_id)
 ):
+    start_time = time.time()
+    
     try:
         image_bytes = await image.read()
-        image_base64 = base64.b64encode(image_bytes).decode('utf-8')
         
+        # The raw upload is analyzed directly; no base64 round-trip
         request = VLMAnalyzeRequest(
-            image=image_base64,
+            image="",
             latitude=latitude,
             longitude=longitude,
             language=language,
@@ -363,8 +374,10 @@ async def analyze_image_multipart(
             enable_tts=enable_tts
         )
         
-        return await analyze_image(request, user_id=user_id)
+        return await _analyze_image_bytes(image_bytes, request, user_id, start_time)
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Multipart upload error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Multipart upload failed: {str(e)}")
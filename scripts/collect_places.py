@@ -9,9 +9,11 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from services.visit_seoul_api import (
     collect_all_places_by_category as collect_visit_seoul_places,
-    get_place_detail as get_visit_seoul_detail,
-    parse_visit_seoul_place,
+    collect_all_places_by_category_concurrent as collect_visit_seoul_places_concurrent,
+    get_place_details_bulk as get_visit_seoul_details,
+    parse_visit_seoul_places,
     map_category_to_visit_seoul_sn,
+    configure_response_cache,
     CATEGORY_DATASET_INFO
 )
 from services.place_parser import merge_place_data
@@ -28,6 +30,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+SECTION_RULE = "=" * 80
+BANNER_RULE = "=" * 60
+
 def normalize_cid(item: Dict) -> Optional[str]:
     return (
         item.get("cid")
@@ -91,7 +96,9 @@ def collect_category_places(
     max_places: Optional[int] = None,
     delay_between_api_calls: float = 1.0,
     create_embeddings: bool = True,
-    lang_code_id: str = "en"
+    lang_code_id: str = "en",
+    concurrency: int = 1,
+    detail_workers: int = 4
 ) -> Dict:
     logger.info(f"=== Starting collection for category: {category} ===")
     
@@ -111,6 +118,21 @@ def collect_category_places(
     }
     stats["expected_total"] = target_total
     
+    def collect_places(category_sn: Optional[str], limit: Optional[int]) -> List[Dict]:
+        if concurrency > 1:
+            return collect_visit_seoul_places_concurrent(
+                category_sn=category_sn,
+                lang_code_id=lang_code_id,
+                max_places=limit,
+                concurrency=concurrency
+            )
+        return collect_visit_seoul_places(
+            category_sn=category_sn,
+            lang_code_id=lang_code_id,
+            max_places=limit,
+            delay_between_pages=delay_between_api_calls
+        )
+    
     try:
         logger.info(f"Step 1: Collecting VISIT SEOUL places for {category}...")
         from services.visit_seoul_api import map_category_to_visit_seoul_sn
@@ -130,12 +152,7 @@ def collect_category_places(
                         break
                     per_sn_limit = remaining
                 
-                items = collect_visit_seoul_places(
-                    category_sn=category_sn,
-                    lang_code_id=lang_code_id,
-                    max_places=per_sn_limit,
-                    delay_between_pages=delay_between_api_calls
-                )
+                items = collect_places(category_sn, per_sn_limit)
                 
                 added = 0
                 for item in items:
@@ -154,12 +171,7 @@ def collect_category_places(
                 )
         else:
             logger.warning(f"Could not map category '{category}' to VISIT SEOUL category_sn, collecting all categories")
-            items = collect_visit_seoul_places(
-                category_sn=None,
-                lang_code_id=lang_code_id,
-                max_places=target_total,
-                delay_between_pages=delay_between_api_calls
-            )
+            items = collect_places(None, target_total)
             for item in items:
                 cid = normalize_cid(item)
                 if not cid:
@@ -179,29 +191,23 @@ def collect_category_places(
             )
         
         logger.info("Step 2: Fetching VISIT SEOUL place details...")
-        visit_seoul_places = []
-        for idx, item in enumerate(visit_seoul_items):
-            try:
-                content_id = item.get("cid") or item.get("contentId") or item.get("content_id") or item.get("id")
-                
-                if not content_id:
-                    logger.warning(f"Skipping VISIT SEOUL item {idx + 1}: missing cid")
-                    continue
-                
-                detail = get_visit_seoul_detail(content_id)
-                time.sleep(delay_between_api_calls)
-                
-                vs_place = parse_visit_seoul_place(item, detail)
-                vs_place["category_label"] = category
-                visit_seoul_places.append(vs_place)
-                
-                if (idx + 1) % 10 == 0:
-                    logger.info(f"Processed {idx + 1}/{len(visit_seoul_items)} VISIT SEOUL places")
-                
-            except Exception as e:
-                error_msg = f"Error processing VISIT SEOUL item {idx + 1}: {e}"
-                logger.error(error_msg, exc_info=True)
-                stats["errors"].append(error_msg)
+        details_by_cid = get_visit_seoul_details(
+            [normalize_cid(item) for item in visit_seoul_items],
+            max_workers=detail_workers,
+            min_interval=delay_between_api_calls
+        )
+        
+        visit_seoul_places = list(parse_visit_seoul_places(
+            visit_seoul_items,
+            details_by_cid,
+            category_label=category
+        ))
+        
+        skipped = len(visit_seoul_items) - len(visit_seoul_places)
+        if skipped:
+            error_msg = f"Skipped {skipped} VISIT SEOUL item(s) with missing cid or parse errors"
+            logger.error(error_msg)
+            stats["errors"].append(error_msg)
         
         logger.info(f"Processed {len(visit_seoul_places)} VISIT SEOUL places with details")
         
@@ -211,7 +217,7 @@ def collect_category_places(
         
         for vs_place in visit_seoul_places:
             try:
-                merged_data = merge_place_data(None, vs_place, category=category)
+                merged_data = merge_place_data(None, vs_place.to_dict(), category=category)
                 
                 place_id = save_place(merged_data)
                 if place_id:
@@ -258,7 +264,9 @@ def collect_all_categories(
     delay_between_api_calls: float = 1.0,
     create_embeddings: bool = True,
     lang_code_id: str = "en",
-    delay_between_categories: float = 2.0
+    delay_between_categories: float = 2.0,
+    concurrency: int = 1,
+    detail_workers: int = 4
 ) -> Dict:
     all_categories = list(CATEGORY_DATASET_INFO.keys())
     logger.info(f"=== Starting collection for ALL categories ({len(all_categories)} categories) ===")
@@ -279,9 +287,9 @@ def collect_all_categories(
     
     for idx, category in enumerate(all_categories, 1):
         logger.info("")
-        logger.info("=" * 80)
+        logger.info(SECTION_RULE)
         logger.info(f"Processing category {idx}/{len(all_categories)}: {category}")
-        logger.info("=" * 80)
+        logger.info(SECTION_RULE)
         
         try:
             category_stats = collect_category_places(
@@ -289,7 +297,9 @@ def collect_all_categories(
                 max_places=max_places_per_category,
                 delay_between_api_calls=delay_between_api_calls,
                 create_embeddings=create_embeddings,
-                lang_code_id=lang_code_id
+                lang_code_id=lang_code_id,
+                concurrency=concurrency,
+                detail_workers=detail_workers
             )
             
             overall_stats["categories_processed"] += 1
@@ -342,7 +352,10 @@ def main():
         "--delay",
         type=float,
         default=1.0,
-        help="Delay between API calls in seconds (default: 1.0)"
+        help=(
+            "Seconds between sequential page requests, and the minimum spacing between "
+            "place detail requests across all detail workers (default: 1.0)"
+        )
     )
     parser.add_argument(
         "--lang-code",
@@ -361,14 +374,38 @@ def main():
         default=2.0,
         help="Delay between categories in seconds when collecting all categories (default: 2.0)"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Concurrent page requests per category; values > 1 use the async collector (default: 1)"
+    )
+    parser.add_argument(
+        "--detail-workers",
+        type=int,
+        default=4,
+        help="Worker threads for fetching place details; requests are still spaced by --delay (default: 4)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the local VISIT SEOUL response cache (.cache/visit_seoul in the repo)"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached VISIT SEOUL responses and re-fetch them (cache is still updated)"
+    )
     
     args = parser.parse_args()
     
+    configure_response_cache(enabled=not args.no_cache, refresh=args.refresh)
+    
     collect_all = args.category is None
     
-    logger.info("=" * 60)
+    logger.info(BANNER_RULE)
     logger.info("Quest of Seoul - Place Collection Script")
-    logger.info("=" * 60)
+    logger.info(BANNER_RULE)
     if collect_all:
         logger.info("Mode: Collecting ALL categories automatically")
         logger.info(f"Categories to process: {', '.join(CATEGORY_DATASET_INFO.keys())}")
@@ -378,9 +415,12 @@ def main():
     logger.info(f"Max places per category: {args.max_places if args.max_places else 'Category target'}")
     logger.info(f"Language code: {args.lang_code}")
     logger.info(f"API call delay: {args.delay}s")
+    logger.info(f"Page fetch concurrency: {args.concurrency}")
+    logger.info(f"Detail fetch workers: {args.detail_workers}")
+    logger.info(f"Response cache: {'disabled' if args.no_cache else ('refresh' if args.refresh else 'enabled')}")
     if collect_all:
         logger.info(f"Delay between categories: {args.delay_between_categories}s")
-    logger.info("=" * 60)
+    logger.info(BANNER_RULE)
     
     if not os.getenv("VISIT_SEOUL_API_KEY"):
         logger.error("VISIT_SEOUL_API_KEY environment variable is required")
@@ -392,13 +432,15 @@ def main():
             delay_between_api_calls=args.delay,
             create_embeddings=not args.no_embeddings,
             lang_code_id=args.lang_code,
-            delay_between_categories=args.delay_between_categories
+            delay_between_categories=args.delay_between_categories,
+            concurrency=args.concurrency,
+            detail_workers=args.detail_workers
         )
         
         logger.info("")
-        logger.info("=" * 80)
+        logger.info(SECTION_RULE)
         logger.info("FINAL COLLECTION STATISTICS (ALL CATEGORIES)")
-        logger.info("=" * 80)
+        logger.info(SECTION_RULE)
         logger.info(f"  Total categories: {overall_stats['total_categories']}")
         logger.info(f"  Categories processed: {overall_stats['categories_processed']}")
         logger.info(f"  Categories succeeded: {overall_stats['categories_succeeded']}")
@@ -423,17 +465,19 @@ def main():
             if len(overall_stats['all_errors']) > 20:
                 logger.warning(f"  ... and {len(overall_stats['all_errors']) - 20} more errors")
         
-        logger.info("=" * 80)
+        logger.info(SECTION_RULE)
     else:
         stats = collect_category_places(
             category=args.category,
             max_places=args.max_places,
             delay_between_api_calls=args.delay,
             create_embeddings=not args.no_embeddings,
-            lang_code_id=args.lang_code
+            lang_code_id=args.lang_code,
+            concurrency=args.concurrency,
+            detail_workers=args.detail_workers
         )
         
-        logger.info("=" * 60)
+        logger.info(BANNER_RULE)
         logger.info("Collection Statistics:")
         logger.info(f"  Category: {stats['category']}")
         logger.info(f"  Lang code: {stats['lang_code_id']}")
@@ -452,7 +496,7 @@ def main():
             if len(stats['errors']) > 10:
                 logger.warning(f"  ... and {len(stats['errors']) - 10} more errors")
         
-        logger.info("=" * 60)
+        logger.info(BANNER_RULE)
 
 
 if __name__ == "__main__":
@@ -3,17 +3,130 @@
 
 import requests
 import base64
+import functools
+import glob
+import hashlib
+import io
 import json
+import mimetypes
+import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 BASE_URL = "http://localhost:8000"
 TEST_USER_ID = "test-user-001"
+BASE64_CHUNK_SIZE = 57 * 1024
+MAX_IMAGE_BYTES = 20 * 1024 * 1024
+TEST_CACHE_ENABLED = os.getenv("QOS_TEST_CACHE") == "1"
+TEST_CACHE_DIR = Path(os.getenv("QOS_TEST_CACHE_DIR", ".cache/test_images"))
+SIMILAR_CACHE_FILE = TEST_CACHE_DIR / "vlm_similar.json"
+
+SESSION_POOL_MAXSIZE = 8
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=SESSION_POOL_MAXSIZE,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False
+    )
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+
+def _encode_file_base64(image_path: Path) -> str:
+    encoded = bytearray()
+    with open(image_path, 'rb') as f:
+        while chunk := f.read(BASE64_CHUNK_SIZE):
+            encoded += base64.b64encode(chunk)
+    return encoded.decode('ascii')
+
+
+def load_image_as_base64(image_path: Path) -> str:
+    if not TEST_CACHE_ENABLED:
+        return _encode_file_base64(image_path)
+    
+    st = image_path.stat()
+    path_key = hashlib.blake2b(str(image_path.resolve()).encode(), digest_size=8).hexdigest()
+    cache_file = TEST_CACHE_DIR / f"{image_path.name}.{path_key}.{st.st_mtime_ns}.{st.st_size}.b64"
+    if cache_file.exists():
+        return cache_file.read_text(encoding='ascii')
+    
+    encoded = _encode_file_base64(image_path)
+    TEST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    for stale in TEST_CACHE_DIR.glob(f"{glob.escape(image_path.name)}.{path_key}.*.b64"):
+        stale.unlink(missing_ok=True)
+    cache_file.write_text(encoded, encoding='ascii')
+    return encoded
+
+
+def download_image_as_base64(url: str) -> str:
+    encoded = bytearray()
+    pending = b""
+    total = 0
+    with SESSION.get(url, timeout=10, stream=True) as response:
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size=BASE64_CHUNK_SIZE):
+            total += len(chunk)
+            if total > MAX_IMAGE_BYTES:
+                raise ValueError(f"Image exceeds {MAX_IMAGE_BYTES} bytes: {url}")
+            # Decoded chunks can be any length; only encode whole 3-byte groups
+            pending += chunk
+            aligned = len(pending) - len(pending) % 3
+            encoded += base64.b64encode(pending[:aligned])
+            pending = pending[aligned:]
+    encoded += base64.b64encode(pending)
+    return encoded.decode('ascii')
+
+
+def _similar_cache_key(image_base64: str, limit: int, threshold: float) -> str:
+    digest = hashlib.blake2b(image_base64.encode('ascii'), digest_size=16).hexdigest()
+    return f"{BASE_URL}|{digest}|{limit}|{threshold}"
+
+
+@functools.lru_cache(maxsize=1)
+def _load_similar_cache() -> Dict[str, Dict]:
+    try:
+        return json.loads(SIMILAR_CACHE_FILE.read_text(encoding='utf-8'))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _store_similar_result(cache_key: str, result: Dict):
+    cache = _load_similar_cache()
+    cache[cache_key] = result
+    TEST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    SIMILAR_CACHE_FILE.write_text(json.dumps(cache, ensure_ascii=False), encoding='utf-8')
+
+
+def load_test_image(image_source: str) -> Optional[str]:
+    if urlparse(image_source).scheme in ("http", "https"):
+        try:
+            return download_image_as_base64(image_source)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"Image download failed: {e}")
+            return None
+    
+    image_file = Path(image_source)
+    if not image_file.exists():
+        print(f"Image not found: {image_source}")
+        return None
+    
+    return load_image_as_base64(image_file)
 
 
 def test_root():
     print("\n=== Root Endpoint ===")
-    response = requests.get(f"{BASE_URL}/")
+    response = SESSION.get(f"{BASE_URL}/")
     print(f"GET / : {response.status_code}")
     print(json.dumps(response.json(), indent=2, ensure_ascii=False))
 
@@ -21,11 +134,11 @@ def test_root():
 def test_health():
     print("\n=== Health Check ===")
     
-    response = requests.get(f"{BASE_URL}/health")
+    response = SESSION.get(f"{BASE_URL}/health")
     print(f"GET /health : {response.status_code}")
     print(json.dumps(response.json(), indent=2, ensure_ascii=False))
     
-    response = requests.get(f"{BASE_URL}/vlm/health")
+    response = SESSION.get(f"{BASE_URL}/vlm/health")
     print(f"\nGET /vlm/health : {response.status_code}")
     print(json.dumps(response.json(), indent=2, ensure_ascii=False))
 
@@ -41,7 +154,7 @@ def test_docent_chat():
         "enable_tts": False
     }
     
-    response = requests.post(f"{BASE_URL}/docent/chat", json=payload)
+    response = SESSION.post(f"{BASE_URL}/docent/chat", json=payload)
     print(f"POST /docent/chat : {response.status_code}")
     
     if response.status_code == 200:
@@ -57,7 +170,7 @@ def test_docent_quiz():
     
     params = {"landmark": "경복궁", "language": "ko"}
     
-    response = requests.post(f"{BASE_URL}/docent/quiz", params=params)
+    response = SESSION.post(f"{BASE_URL}/docent/quiz", params=params)
     print(f"POST /docent/quiz : {response.status_code}")
     
     if response.status_code == 200:
@@ -78,7 +191,7 @@ def test_docent_tts():
         "prefer_url": False
     }
     
-    response = requests.post(f"{BASE_URL}/docent/tts", json=payload)
+    response = SESSION.post(f"{BASE_URL}/docent/tts", json=payload)
     print(f"POST /docent/tts : {response.status_code}")
     
     if response.status_code == 200:
@@ -91,7 +204,7 @@ def test_docent_tts():
 def test_docent_history():
     print("\n=== Docent History ===")
     
-    response = requests.get(f"{BASE_URL}/docent/history/{TEST_USER_ID}?limit=5")
+    response = SESSION.get(f"{BASE_URL}/docent/history/{TEST_USER_ID}?limit=5")
     print(f"GET /docent/history/{{user_id}} : {response.status_code}")
     
     if response.status_code == 200:
@@ -104,7 +217,7 @@ def test_docent_history():
 def test_quest_list():
     print("\n=== Quest List ===")
     
-    response = requests.get(f"{BASE_URL}/quest/list")
+    response = SESSION.get(f"{BASE_URL}/quest/list")
     print(f"GET /quest/list : {response.status_code}")
     
     if response.status_code == 200:
@@ -126,7 +239,7 @@ def test_quest_nearby():
         "radius_km": 2.0
     }
     
-    response = requests.post(f"{BASE_URL}/quest/nearby", json=payload)
+    response = SESSION.post(f"{BASE_URL}/quest/nearby", json=payload)
     print(f"POST /quest/nearby : {response.status_code}")
     
     if response.status_code == 200:
@@ -148,7 +261,7 @@ def test_quest_progress():
         "status": "in_progress"
     }
     
-    response = requests.post(f"{BASE_URL}/quest/progress", json=payload)
+    response = SESSION.post(f"{BASE_URL}/quest/progress", json=payload)
     print(f"POST /quest/progress : {response.status_code}")
     
     if response.status_code == 200:
@@ -162,7 +275,7 @@ def test_quest_progress():
 def test_quest_user():
     print("\n=== Quest User ===")
     
-    response = requests.get(f"{BASE_URL}/quest/user/{TEST_USER_ID}")
+    response = SESSION.get(f"{BASE_URL}/quest/user/{TEST_USER_ID}")
     print(f"GET /quest/user/{{user_id}} : {response.status_code}")
     
     if response.status_code == 200:
@@ -175,7 +288,7 @@ def test_quest_user():
 def test_quest_detail():
     print("\n=== Quest Detail ===")
     
-    response = requests.get(f"{BASE_URL}/quest/1")
+    response = SESSION.get(f"{BASE_URL}/quest/1")
     print(f"GET /quest/{{quest_id}} : {response.status_code}")
     
     if response.status_code == 200:
@@ -189,7 +302,7 @@ def test_quest_detail():
 def test_reward_points():
     print("\n=== Reward Points ===")
     
-    response = requests.get(f"{BASE_URL}/reward/points/{TEST_USER_ID}")
+    response = SESSION.get(f"{BASE_URL}/reward/points/{TEST_USER_ID}")
     print(f"GET /reward/points/{{user_id}} : {response.status_code}")
     
     if response.status_code == 200:
@@ -209,7 +322,7 @@ def test_reward_add_points():
         "reason": "Test points"
     }
     
-    response = requests.post(f"{BASE_URL}/reward/points/add", json=payload)
+    response = SESSION.post(f"{BASE_URL}/reward/points/add", json=payload)
     print(f"POST /reward/points/add : {response.status_code}")
     
     if response.status_code == 200:
@@ -223,7 +336,7 @@ def test_reward_add_points():
 def test_reward_list():
     print("\n=== Reward List ===")
     
-    response = requests.get(f"{BASE_URL}/reward/list")
+    response = SESSION.get(f"{BASE_URL}/reward/list")
     print(f"GET /reward/list : {response.status_code}")
     
     if response.status_code == 200:
@@ -239,7 +352,7 @@ def test_reward_list():
 def test_reward_claimed():
     print("\n=== Reward Claimed ===")
     
-    response = requests.get(f"{BASE_URL}/reward/claimed/{TEST_USER_ID}")
+    response = SESSION.get(f"{BASE_URL}/reward/claimed/{TEST_USER_ID}")
     print(f"GET /reward/claimed/{{user_id}} : {response.status_code}")
     
     if response.status_code == 200:
@@ -257,7 +370,7 @@ def test_reward_claim():
         "reward_id": 1
     }
     
-    response = requests.post(f"{BASE_URL}/reward/claim", json=payload)
+    response = SESSION.post(f"{BASE_URL}/reward/claim", json=payload)
     print(f"POST /reward/claim : {response.status_code}")
     
     if response.status_code == 200:
@@ -276,7 +389,7 @@ def test_reward_use():
     
     params = {"user_id": TEST_USER_ID}
     
-    response = requests.post(f"{BASE_URL}/reward/use/1", params=params)
+    response = SESSION.post(f"{BASE_URL}/reward/use/1", params=params)
     print(f"POST /reward/use/{{reward_id}} : {response.status_code}")
     
     if response.status_code == 200:
@@ -294,16 +407,10 @@ def test_vlm_analyze(image_path: str = None):
         print("Image path required for this test")
         return
     
-    image_file = Path(image_path)
-    if not image_file.exists():
-        print(f"Image not found: {image_path}")
+    image_base64 = load_test_image(image_path)
+    if image_base64 is None:
         return
     
-    with open(image_file, 'rb') as f:
-        image_bytes = f.read()
-    
-    image_base64 = base64.b64encode(image_bytes).decode('utf-8')
-    
     payload = {
         "user_id": TEST_USER_ID,
         "image": image_base64,
@@ -314,12 +421,51 @@ def test_vlm_analyze(image_path: str = None):
         "prefer_url": False
     }
     
-    print(f"Image: {image_file.name} ({len(image_bytes)} bytes)")
+    print(f"Image: {Path(urlparse(image_path).path).name} ({len(image_base64)} chars base64)")
     print("Analyzing...")
     
-    response = requests.post(f"{BASE_URL}/vlm/analyze", json=payload, timeout=60)
+    response = SESSION.post(f"{BASE_URL}/vlm/analyze", json=payload, timeout=60)
     print(f"POST /vlm/analyze : {response.status_code}")
+    _print_analyze_result(response)
+
+
+def test_vlm_analyze_multipart(image_path: str = None):
+    print("\n=== VLM Analyze (multipart) ===")
     
+    if not image_path:
+        print("Image path required for this test")
+        return
+    
+    if urlparse(image_path).scheme in ("http", "https"):
+        print("Remote image - using base64 endpoint")
+        test_vlm_analyze(image_path)
+        return
+    
+    image_file = Path(image_path)
+    if not image_file.exists():
+        print(f"Image not found: {image_path}")
+        return
+    
+    data = {
+        "latitude": 37.5796,
+        "longitude": 126.9770,
+        "language": "ko",
+        "enable_tts": False,
+        "prefer_url": False
+    }
+    
+    print(f"Image: {image_file.name} ({image_file.stat().st_size} bytes)")
+    print("Analyzing...")
+    
+    with open(image_file, 'rb') as f:
+        content_type = mimetypes.guess_type(image_file.name)[0] or "application/octet-stream"
+        files = {"image": (image_file.name, f, content_type)}
+        response = SESSION.post(f"{BASE_URL}/vlm/analyze-multipart", files=files, data=data, timeout=60)
+    print(f"POST /vlm/analyze-multipart : {response.status_code}")
+    _print_analyze_result(response)
+
+
+def _print_analyze_result(response: requests.Response):
     if response.status_code == 200:
         result = response.json()
         print(f"Description: {result['description'][:100]}...")
@@ -338,28 +484,30 @@ def test_vlm_similar(image_path: str = None):
         print("Image path required for this test")
         return
     
-    image_file = Path(image_path)
-    if not image_file.exists():
-        print(f"Image not found: {image_path}")
+    image_base64 = load_test_image(image_path)
+    if image_base64 is None:
         return
     
-    with open(image_file, 'rb') as f:
-        image_bytes = f.read()
-    
-    image_base64 = base64.b64encode(image_bytes).decode('utf-8')
-    
     payload = {
         "image": image_base64,
         "limit": 3,
         "threshold": 0.7
     }
     
-    response = requests.post(f"{BASE_URL}/vlm/similar", json=payload)
+    cache_key = _similar_cache_key(image_base64, payload["limit"], payload["threshold"]) if TEST_CACHE_ENABLED else None
+    if cache_key and cache_key in _load_similar_cache():
+        print("POST /vlm/similar : 200 (cached)")
+        print(f"Similar images: {_load_similar_cache()[cache_key].get('count', 0)}")
+        return
+    
+    response = SESSION.post(f"{BASE_URL}/vlm/similar", json=payload)
     print(f"POST /vlm/similar : {response.status_code}")
     
     if response.status_code == 200:
         result = response.json()
         print(f"Similar images: {result.get('count', 0)}")
+        if cache_key:
+            _store_similar_result(cache_key, result)
     else:
         print(f"Error: {response.text}")
 
@@ -374,7 +522,7 @@ def test_vlm_nearby_places():
         "limit": 5
     }
     
-    response = requests.get(f"{BASE_URL}/vlm/places/nearby", params=params)
+    response = SESSION.get(f"{BASE_URL}/vlm/places/nearby", params=params)
     print(f"GET /vlm/places/nearby : {response.status_code}")
     
     if response.status_code == 200:
@@ -391,16 +539,10 @@ def test_recommend_similar_places(image_path: str = None):
         print("Image path required for this test")
         return
     
-    image_file = Path(image_path)
-    if not image_file.exists():
-        print(f"Image not found: {image_path}")
+    image_base64 = load_test_image(image_path)
+    if image_base64 is None:
         return
     
-    with open(image_file, 'rb') as f:
-        image_bytes = f.read()
-    
-    image_base64 = base64.b64encode(image_bytes).decode('utf-8')
-    
     payload = {
         "user_id": TEST_USER_ID,
         "image": image_base64,
@@ -411,9 +553,9 @@ def test_recommend_similar_places(image_path: str = None):
         "quest_only": True
     }
     
-    print(f"Image: {image_file.name}")
+    print(f"Image: {Path(urlparse(image_path).path).name}")
     
-    response = requests.post(f"{BASE_URL}/recommend/similar-places", json=payload, timeout=30)
+    response = SESSION.post(f"{BASE_URL}/recommend/similar-places", json=payload, timeout=30)
     print(f"POST /recommend/similar-places : {response.status_code}")
     
     if response.status_code == 200:
@@ -433,7 +575,7 @@ def test_recommend_nearby_quests():
         "limit": 10
     }
     
-    response = requests.get(f"{BASE_URL}/recommend/nearby-quests", params=params)
+    response = SESSION.get(f"{BASE_URL}/recommend/nearby-quests", params=params)
     print(f"GET /recommend/nearby-quests : {response.status_code}")
     
     if response.status_code == 200:
@@ -446,7 +588,7 @@ def test_recommend_nearby_quests():
 def test_recommend_category():
     print("\n=== Recommend Category ===")
     
-    response = requests.get(f"{BASE_URL}/recommend/quests/category/역사유적?limit=10")
+    response = SESSION.get(f"{BASE_URL}/recommend/quests/category/역사유적?limit=10")
     print(f"GET /recommend/quests/category/{{category}} : {response.status_code}")
     
     if response.status_code == 200:
@@ -459,7 +601,7 @@ def test_recommend_category():
 def test_recommend_stats():
     print("\n=== Recommend Stats ===")
     
-    response = requests.get(f"{BASE_URL}/recommend/stats")
+    response = SESSION.get(f"{BASE_URL}/recommend/stats")
     print(f"GET /recommend/stats : {response.status_code}")
     
     if response.status_code == 200:
@@ -476,7 +618,7 @@ def test_recommend_quest_detail():
     
     quest_id = "1"
     
-    response = requests.get(f"{BASE_URL}/recommend/quests/{quest_id}")
+    response = SESSION.get(f"{BASE_URL}/recommend/quests/{quest_id}")
     print(f"GET /recommend/quests/{{quest_id}} : {response.status_code}")
     
     if response.status_code == 200:
@@ -500,7 +642,7 @@ def test_recommend_submit():
         "answer": 1
     }
     
-    response = requests.post(f"{BASE_URL}/recommend/quests/{quest_id}/submit", params=params)
+    response = SESSION.post(f"{BASE_URL}/recommend/quests/{quest_id}/submit", params=params)
     print(f"POST /recommend/quests/{{quest_id}}/submit : {response.status_code}")
     
     if response.status_code == 200:
@@ -516,7 +658,7 @@ def test_recommend_submit():
 def test_vlm_health():
     print("\n=== VLM Health ===")
     
-    response = requests.get(f"{BASE_URL}/vlm/health")
+    response = SESSION.get(f"{BASE_URL}/vlm/health")
     print(f"GET /vlm/health : {response.status_code}")
     
     if response.status_code == 200:
@@ -528,6 +670,194 @@ def test_vlm_health():
         print(f"Error: {response.text}")
 
 
+NON_IMAGE_TESTS = (
+    test_root,
+    test_health,
+    test_docent_chat,
+    test_docent_quiz,
+    test_docent_tts,
+    test_docent_history,
+    test_quest_list,
+    test_quest_nearby,
+    test_quest_progress,
+    test_quest_user,
+    test_quest_detail,
+    test_reward_points,
+    test_reward_add_points,
+    test_reward_list,
+    test_reward_claimed,
+    test_reward_claim,
+    test_reward_use,
+    test_vlm_nearby_places,
+    test_vlm_health,
+    test_recommend_nearby_quests,
+    test_recommend_category,
+    test_recommend_quest_detail,
+    test_recommend_submit,
+    test_recommend_stats,
+)
+
+# Writes and the reads that observe them run in suite order within one worker
+ORDERED_TEST_CHAINS = (
+    (test_docent_chat, test_docent_history),
+    (
+        test_quest_progress,
+        test_quest_user,
+        test_quest_detail,
+        test_recommend_quest_detail,
+        test_recommend_submit,
+    ),
+    (
+        test_reward_points,
+        test_reward_add_points,
+        test_reward_claimed,
+        test_reward_claim,
+        test_reward_use,
+    ),
+)
+
+
+def full_tests(image_path: str) -> List[Callable[[], None]]:
+    tests = list(NON_IMAGE_TESTS)
+    vlm_index = tests.index(test_vlm_nearby_places)
+    tests[vlm_index:vlm_index] = [
+        functools.partial(test_vlm_analyze, image_path),
+        functools.partial(test_vlm_analyze_multipart, image_path),
+        functools.partial(test_vlm_similar, image_path),
+    ]
+    recommend_index = tests.index(test_recommend_nearby_quests)
+    tests.insert(recommend_index, functools.partial(test_recommend_similar_places, image_path))
+    return tests
+
+
+SINGLE_TESTS = {
+    "root": test_root,
+    "health": test_health,
+}
+
+# Group flag -> {individual flag: test}; a group flag runs every test in it
+TEST_GROUPS = {
+    "docent": {
+        "docent_chat": test_docent_chat,
+        "docent_quiz": test_docent_quiz,
+        "docent_tts": test_docent_tts,
+        "docent_history": test_docent_history,
+    },
+    "quest": {
+        "quest_list": test_quest_list,
+        "quest_nearby": test_quest_nearby,
+        "quest_progress": test_quest_progress,
+        "quest_user": test_quest_user,
+        "quest_detail": test_quest_detail,
+    },
+    "reward": {
+        "reward_points": test_reward_points,
+        "reward_add": test_reward_add_points,
+        "reward_list": test_reward_list,
+        "reward_claimed": test_reward_claimed,
+        "reward_claim": test_reward_claim,
+        "reward_use": test_reward_use,
+    },
+    "vlm": {
+        "vlm_analyze": test_vlm_analyze,
+        "vlm_analyze_multipart": test_vlm_analyze_multipart,
+        "vlm_similar": test_vlm_similar,
+        "vlm_nearby": test_vlm_nearby_places,
+        "vlm_health": test_vlm_health,
+    },
+    "recommend": {
+        "recommend_quests": test_recommend_nearby_quests,
+        "recommend_category": test_recommend_category,
+        "recommend_quest_detail": test_recommend_quest_detail,
+        "recommend_submit": test_recommend_submit,
+        "recommend_stats": test_recommend_stats,
+        "recommend_places": test_recommend_similar_places,
+    },
+}
+
+IMAGE_TESTS = frozenset({
+    test_vlm_analyze,
+    test_vlm_analyze_multipart,
+    test_vlm_similar,
+    test_recommend_similar_places,
+})
+IMAGE_REQUIRED_GROUPS = frozenset({"vlm"})
+
+
+def run_selected_tests(args):
+    for flag, test in SINGLE_TESTS.items():
+        if getattr(args, flag):
+            test()
+    
+    for group, tests in TEST_GROUPS.items():
+        if getattr(args, group):
+            if group in IMAGE_REQUIRED_GROUPS and not args.image:
+                print(f"Error: --{group} requires --image parameter")
+                sys.exit(1)
+            selected = [test for test in tests.values() if args.image or test not in IMAGE_TESTS]
+        else:
+            selected = [test for flag, test in tests.items() if getattr(args, flag)]
+        
+        for test in selected:
+            if test in IMAGE_TESTS:
+                test(args.image)
+            else:
+                test()
+
+
+class _ThreadLocalStdout:
+    """Buffers print() output per worker thread so parallel tests don't interleave."""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+    
+    def capture(self):
+        self._local.buffer = io.StringIO()
+    
+    def release(self) -> str:
+        output = self._local.buffer.getvalue()
+        del self._local.buffer
+        return output
+    
+    def write(self, text: str) -> int:
+        return getattr(self._local, "buffer", self.stream).write(text)
+    
+    def flush(self):
+        getattr(self._local, "buffer", self.stream).flush()
+
+
+def run_tests_parallel(tests: List[Callable[[], None]], max_workers: int = 4):
+    max_workers = max(1, min(max_workers, SESSION_POOL_MAXSIZE))
+    chained = {test for chain in ORDERED_TEST_CHAINS for test in chain}
+    tasks = [(test,) for test in tests if test not in chained]
+    tasks.extend(tuple(test for test in tests if test in chain) for chain in ORDERED_TEST_CHAINS)
+    
+    stdout = _ThreadLocalStdout(sys.stdout)
+    
+    def run(task):
+        stdout.capture()
+        try:
+            for test in task:
+                test()
+        except requests.exceptions.ConnectionError:
+            raise
+        except Exception as e:
+            print(f"Error: {e}")
+        finally:
+            output = stdout.release()
+        return output
+    
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run, task) for task in tasks if task]
+            for future in as_completed(futures):
+                stdout.stream.write(future.result())
+    finally:
+        sys.stdout = stdout.stream
+
+
 def main():
     import argparse
     
@@ -561,6 +891,7 @@ def main():
     
     parser.add_argument("--vlm", action="store_true", help="Test all VLM endpoints (requires --image)")
     parser.add_argument("--vlm-analyze", action="store_true", help="Test VLM analyze")
+    parser.add_argument("--vlm-analyze-multipart", action="store_true", help="Test VLM analyze with a multipart upload")
     parser.add_argument("--vlm-similar", action="store_true", help="Test VLM similar")
     parser.add_argument("--vlm-nearby", action="store_true", help="Test VLM nearby places")
     parser.add_argument("--vlm-health", action="store_true", help="Test VLM health")
@@ -575,6 +906,8 @@ def main():
     
     parser.add_argument("--all", action="store_true", help="Run all non-image tests")
     parser.add_argument("--full", action="store_true", help="Run ALL tests (requires --image)")
+    parser.add_argument("--parallel", action="store_true", help="Run --all/--full tests concurrently")
+    parser.add_argument("--workers", type=int, default=4, help=f"Worker threads for --parallel (max {SESSION_POOL_MAXSIZE})")
     
     args = parser.parse_args()
     
@@ -585,161 +918,18 @@ def main():
     print(f"Test User ID: {TEST_USER_ID}\n")
     
     try:
-        if args.full:
-            if not args.image:
+        if args.full or args.all:
+            if args.full and not args.image:
                 print("Error: --full requires --image parameter")
                 sys.exit(1)
-            test_root()
-            test_health()
-            test_docent_chat()
-            test_docent_quiz()
-            test_docent_tts()
-            test_docent_history()
-            test_quest_list()
-            test_quest_nearby()
-            test_quest_progress()
-            test_quest_user()
-            test_quest_detail()
-            test_reward_points()
-            test_reward_add_points()
-            test_reward_list()
-            test_reward_claimed()
-            test_reward_claim()
-            test_reward_use()
-            test_vlm_analyze(args.image)
-            test_vlm_similar(args.image)
-            test_vlm_nearby_places()
-            test_vlm_health()
-            test_recommend_similar_places(args.image)
-            test_recommend_nearby_quests()
-            test_recommend_category()
-            test_recommend_quest_detail()
-            test_recommend_submit()
-            test_recommend_stats()
-        elif args.all:
-            test_root()
-            test_health()
-            test_docent_chat()
-            test_docent_quiz()
-            test_docent_tts()
-            test_docent_history()
-            test_quest_list()
-            test_quest_nearby()
-            test_quest_progress()
-            test_quest_user()
-            test_quest_detail()
-            test_reward_points()
-            test_reward_add_points()
-            test_reward_list()
-            test_reward_claimed()
-            test_reward_claim()
-            test_reward_use()
-            test_vlm_nearby_places()
-            test_vlm_health()
-            test_recommend_nearby_quests()
-            test_recommend_category()
-            test_recommend_quest_detail()
-            test_recommend_submit()
-            test_recommend_stats()
-        else:
-            if args.root:
-                test_root()
-            if args.health:
-                test_health()
-            
-            if args.docent:
-                test_docent_chat()
-                test_docent_quiz()
-                test_docent_tts()
-                test_docent_history()
-            else:
-                if args.docent_chat:
-                    test_docent_chat()
-                if args.docent_quiz:
-                    test_docent_quiz()
-                if args.docent_tts:
-                    test_docent_tts()
-                if args.docent_history:
-                    test_docent_history()
-            
-            if args.quest:
-                test_quest_list()
-                test_quest_nearby()
-                test_quest_progress()
-                test_quest_user()
-                test_quest_detail()
-            else:
-                if args.quest_list:
-                    test_quest_list()
-                if args.quest_nearby:
-                    test_quest_nearby()
-                if args.quest_progress:
-                    test_quest_progress()
-                if args.quest_user:
-                    test_quest_user()
-                if args.quest_detail:
-                    test_quest_detail()
-            
-            if args.reward:
-                test_reward_points()
-                test_reward_add_points()
-                test_reward_list()
-                test_reward_claimed()
-                test_reward_claim()
-                test_reward_use()
+            tests = full_tests(args.image) if args.full else list(NON_IMAGE_TESTS)
+            if args.parallel:
+                run_tests_parallel(tests, args.workers)
             else:
-                if args.reward_points:
-                    test_reward_points()
-                if args.reward_add:
-                    test_reward_add_points()
-                if args.reward_list:
-                    test_reward_list()
-                if args.reward_claimed:
-                    test_reward_claimed()
-                if args.reward_claim:
-                    test_reward_claim()
-                if args.reward_use:
-                    test_reward_use()
-            
-            if args.vlm:
-                if not args.image:
-                    print("Error: --vlm requires --image parameter")
-                    sys.exit(1)
-                test_vlm_analyze(args.image)
-                test_vlm_similar(args.image)
-                test_vlm_nearby_places()
-                test_vlm_health()
-            else:
-                if args.vlm_analyze:
-                    test_vlm_analyze(args.image)
-                if args.vlm_similar:
-                    test_vlm_similar(args.image)
-                if args.vlm_nearby:
-                    test_vlm_nearby_places()
-                if args.vlm_health:
-                    test_vlm_health()
-            
-            if args.recommend:
-                test_recommend_nearby_quests()
-                test_recommend_category()
-                test_recommend_quest_detail()
-                test_recommend_submit()
-                test_recommend_stats()
-                if args.image:
-                    test_recommend_similar_places(args.image)
-            else:
-                if args.recommend_places:
-                    test_recommend_similar_places(args.image)
-                if args.recommend_quests:
-                    test_recommend_nearby_quests()
-                if args.recommend_category:
-                    test_recommend_category()
-                if args.recommend_quest_detail:
-                    test_recommend_quest_detail()
-                if args.recommend_submit:
-                    test_recommend_submit()
-                if args.recommend_stats:
-                    test_recommend_stats()
+                for test in tests:
+                    test()
+        else:
+            run_selected_tests(args)
             
             if not any(vars(args).values()):
                 parser.print_help()
@@ -1,12 +1,67 @@
 import os
+import math
+import re
+import functools
+import contextlib
+import hashlib
+import asyncio
+import json
 import logging
 import requests
+import aiohttp
 import time
-from typing import List, Dict, Optional, Set
+import threading
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from tenacity import AsyncRetrying, RetryCallState, retry_if_exception, stop_after_attempt, wait_random_exponential
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields
+from typing import Any, List, Dict, Iterable, Iterator, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+    logger.info("orjson not installed, using stdlib json for VISIT SEOUL payloads")
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+    logger.info("pyahocorasick not installed, using regex keyword matching")
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    diskcache = None
+    DISKCACHE_AVAILABLE = False
+    logger.info("diskcache not installed, VISIT SEOUL responses will not be persisted")
+
 VISIT_SEOUL_BASE_URL = "https://api-call.visitseoul.net/api/v1"
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+SESSION_POOL_CONNECTIONS = 16
+SESSION_POOL_MAXSIZE = 32
+ASYNC_CONNECTION_LIMIT = 20
+ASYNC_KEEPALIVE_TIMEOUT = 60
+ASYNC_RETRY_MAX_WAIT = 30
+RESPONSE_CACHE_DIR = os.getenv(
+    "VISIT_SEOUL_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "visit_seoul")
+)
+RESPONSE_CACHE_TTL = int(os.getenv("VISIT_SEOUL_CACHE_TTL", "86400"))
+RESPONSE_CACHE_SIZE_LIMIT = 2 ** 30
+
+_response_cache = None
+# Opt-in: long-running callers such as the API server must not serve day-old data
+_response_cache_enabled = os.getenv("VISIT_SEOUL_CACHE_ENABLED", "").lower() in ("1", "true", "yes")
+_response_cache_refresh = False
 
 
 def normalize_category_path(path: Optional[str]) -> str:
@@ -18,6 +73,7 @@ def normalize_category_path(path: Optional[str]) -> str:
 
 CATEGORY_DATASET_INFO: Dict[str, Dict] = {
     "Attractions": {
+        "fuzzy_paths": True,
         "include_paths": [
             "문화관광 > 랜드마크관광",
             "문화관광 > 테마공원",
@@ -32,6 +88,7 @@ CATEGORY_DATASET_INFO: Dict[str, Dict] = {
         "include_keywords_en": ["Landmark", "Theme Park", "Attraction", "Hot Spot"]
     },
     "History": {
+        "fuzzy_paths": True,
         "include_paths": [
             "역사관광"
         ],
@@ -44,6 +101,7 @@ CATEGORY_DATASET_INFO: Dict[str, Dict] = {
         "include_keywords_en": ["History", "Historic", "Heritage", "Palace", "Traditional", "Historical Sites", "Religious Sites"]
     },
     "Culture": {
+        "fuzzy_paths": True,
         "include_paths": [
             "문화관광 > 전시시설",
             "문화관광 > 기타전시시설",
@@ -62,6 +120,7 @@ CATEGORY_DATASET_INFO: Dict[str, Dict] = {
         "include_keywords_en": ["Museum", "Gallery", "Exhibition", "Art Gallery", "Art Museum"]
     },
     "Nature": {
+        "fuzzy_paths": True,
         "include_paths": [
             "자연관광",
             "문화관광 > 도시공원"
@@ -85,6 +144,7 @@ CATEGORY_DATASET_INFO: Dict[str, Dict] = {
         "exclude_keywords_en": ["Cafe", "Coffee", "Bar", "Tea House", "Cafes & Tea Shops", "Bars & Clubs"]
     },
     "Drinks": {
+        "fuzzy_paths": True,
         "include_paths": [
             "음식 > 카페/찻집",
             "음식 > 주점"
@@ -97,6 +157,7 @@ CATEGORY_DATASET_INFO: Dict[str, Dict] = {
         "include_keywords_en": ["Cafe", "Coffee", "Bar", "Tea House", "Beverage"]
     },
     "Shopping": {
+        "fuzzy_paths": True,
         "include_paths": [
             "쇼핑"
         ],
@@ -113,6 +174,7 @@ CATEGORY_DATASET_INFO: Dict[str, Dict] = {
         "include_keywords_en": ["Shopping", "Market", "Store", "Shopping Mall", "Department Store", "Duty Free", "Traditional Market"]
     },
     "Activities": {
+        "fuzzy_paths": True,
         "include_paths": [
             "체험관광",
             "문화관광 > 레저스포츠시설"
@@ -153,6 +215,122 @@ CATEGORY_DATASET_INFO: Dict[str, Dict] = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class _Matcher:
+    include_paths: Tuple[str, ...]
+    include_path_segments: Tuple[Tuple[Tuple[str, Tuple[str, ...]], ...], ...]
+    descendant_prefixes: Tuple[str, ...]
+    include_prefixes: Tuple[str, ...]
+    include_prefix_tuple: Tuple[str, ...]
+    include_keywords: Tuple[str, ...]
+    include_keywords_lower: Tuple[str, ...]
+    include_automaton: Any
+    exclude_keywords: Tuple[str, ...]
+    exclude_automaton: Any
+
+
+@dataclass(frozen=True, slots=True)
+class _CategoryMatcher:
+    en: Optional[_Matcher]
+    ko: Optional[_Matcher]
+
+
+_COMPILED_CATEGORY_MATCHERS: Dict[str, _CategoryMatcher] = {}
+_PATH_TO_CATEGORIES: Dict[bool, Dict[str, List[str]]] = {True: {}, False: {}}
+
+
+def _build_automaton(keywords: Tuple[str, ...]):
+    if not keywords:
+        return None
+    if not AHOCORASICK_AVAILABLE:
+        return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def _contains_any_keyword(text: str, keywords: Tuple[str, ...], automaton=None) -> bool:
+    if isinstance(automaton, re.Pattern):
+        return automaton.search(text) is not None
+    if automaton is not None:
+        for _ in automaton.iter(text):
+            return True
+        return False
+    return any(keyword in text for keyword in keywords)
+
+
+def _fuzzy_path_match(
+    path_segments_lower: List[str],
+    include_path_segments: Tuple[Tuple[Tuple[str, Tuple[str, ...]], ...], ...]
+) -> bool:
+    for include_segments in include_path_segments:
+        if len(include_segments) > len(path_segments_lower):
+            continue
+        for path_seg, (include_seg, long_words) in zip(path_segments_lower, include_segments):
+            if (include_seg not in path_seg and 
+                path_seg not in include_seg and
+                not any(word in path_seg for word in long_words)):
+                break
+        else:
+            return True
+    return False
+
+
+def _build_matcher(category: str, category_info: Dict, is_english: bool) -> Optional[_Matcher]:
+    suffix = "_en" if is_english else ""
+    include_paths = tuple(
+        normalize_category_path(p) for p in category_info.get(f"include_paths{suffix}") or []
+    )
+    include_prefixes = tuple(
+        normalize_category_path(p) for p in category_info.get(f"include_prefixes{suffix}") or []
+    )
+    include_keywords = tuple(category_info.get(f"include_keywords{suffix}") or [])
+    exclude_keywords = tuple(category_info.get(f"exclude_keywords{suffix}") or [])
+    
+    if not include_paths and not include_keywords and not include_prefixes:
+        return None
+    
+    for path in include_paths:
+        _PATH_TO_CATEGORIES[is_english].setdefault(path, []).append(category)
+    
+    include_keywords_lower = tuple(k.lower() for k in include_keywords)
+    return _Matcher(
+        include_paths=include_paths,
+        include_path_segments=tuple(
+            tuple(
+                (seg, tuple(word for word in seg.split() if len(word) > 3))
+                for seg in (s.strip().lower() for s in p.split(" > "))
+            )
+            for p in include_paths
+        ) if category_info.get("fuzzy_paths") else (),
+        descendant_prefixes=tuple(p + " > " for p in include_paths),
+        include_prefixes=include_prefixes,
+        include_prefix_tuple=tuple(p for p in include_prefixes if p),
+        include_keywords=include_keywords,
+        include_keywords_lower=include_keywords_lower,
+        include_automaton=_build_automaton(include_keywords_lower),
+        exclude_keywords=exclude_keywords,
+        exclude_automaton=_build_automaton(exclude_keywords)
+    )
+
+
+def _build_matchers() -> None:
+    _COMPILED_CATEGORY_MATCHERS.clear()
+    for path_index in _PATH_TO_CATEGORIES.values():
+        path_index.clear()
+    for category, category_info in CATEGORY_DATASET_INFO.items():
+        _COMPILED_CATEGORY_MATCHERS[category] = _CategoryMatcher(
+            en=_build_matcher(category, category_info, True),
+            ko=_build_matcher(category, category_info, False)
+        )
+
+
+_build_matchers()
+
+
+@functools.lru_cache(maxsize=1)
 def get_visit_seoul_api_key() -> str:
     api_key = os.getenv("VISIT_SEOUL_API_KEY")
     if not api_key:
@@ -160,46 +338,191 @@ def get_visit_seoul_api_key() -> str:
     return api_key
 
 
-def get_api_headers() -> Dict[str, str]:
-    return {
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json;charset=UTF-8"}
+
+
+@functools.lru_cache(maxsize=2)
+def _cached_headers(json_body: bool = False) -> Dict[str, str]:
+    headers = {
         "Accept": "application/json;charset=UTF-8",
+        "Accept-Encoding": "gzip",
         "VISITSEOUL-API-KEY": get_visit_seoul_api_key()
     }
+    if json_body:
+        headers.update(_JSON_CONTENT_TYPE)
+    return headers
+
+
+def get_api_headers() -> Dict[str, str]:
+    return dict(_cached_headers())
+
+
+@functools.lru_cache(maxsize=4)
+def _get_session(retry_count: int = 5, retry_delay: float = 1.0) -> requests.Session:
+    # retry_count counts attempts, like stop_after_attempt in the async path
+    retry = Retry(
+        total=max(retry_count - 1, 0),
+        backoff_factor=retry_delay / 2,
+        status_forcelist=RETRYABLE_STATUS_CODES,
+        allowed_methods=("GET", "POST"),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        max_retries=retry,
+        pool_connections=SESSION_POOL_CONNECTIONS,
+        pool_maxsize=SESSION_POOL_MAXSIZE
+    )
+    session = requests.Session()
+    session.headers.update(_cached_headers())
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _json_loads(data: bytes) -> Any:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(response: requests.Response) -> Dict:
+    return _json_loads(response.content)
+
+
+def _places_payload(
+    lang_code_id: str,
+    sort_type: str,
+    page_no: int,
+    category: Optional[str] = None,
+    keyword: Optional[str] = None
+) -> bytes:
+    payload = {
+        "lang_code_id": lang_code_id,
+        "sort_type": sort_type,
+        "page_no": page_no
+    }
+    
+    if category:
+        payload["com_ctgry_sn"] = category
+    
+    if keyword:
+        payload["keyword"] = keyword
+    
+    return _json_dumps(payload)
+
+
+def configure_response_cache(enabled: bool = True, refresh: bool = False) -> None:
+    global _response_cache_enabled, _response_cache_refresh
+    _response_cache_enabled = enabled
+    _response_cache_refresh = refresh
+
+
+def _get_response_cache():
+    global _response_cache
+    if not DISKCACHE_AVAILABLE or not _response_cache_enabled:
+        return None
+    if _response_cache is None:
+        try:
+            _response_cache = diskcache.Cache(RESPONSE_CACHE_DIR, size_limit=RESPONSE_CACHE_SIZE_LIMIT)
+        except Exception as e:
+            logger.warning("Failed to open VISIT SEOUL response cache at %s: %s", RESPONSE_CACHE_DIR, e)
+            configure_response_cache(enabled=False)
+            return None
+    return _response_cache
+
+
+def _response_cache_key(url: str, payload: bytes = b"") -> str:
+    return hashlib.blake2b(url.encode() + payload).hexdigest()
+
+
+def _cache_get(key: str) -> Optional[Any]:
+    cache = _get_response_cache()
+    if cache is None or _response_cache_refresh:
+        return None
+    return cache.get(key)
+
+
+def _cache_set(key: str, value: Any) -> None:
+    cache = _get_response_cache()
+    if cache is not None:
+        cache.set(key, value, expire=RESPONSE_CACHE_TTL)
+
+
+def _is_retryable_error(error: Exception) -> bool:
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in RETRYABLE_STATUS_CODES
+    return isinstance(error, (
+        aiohttp.ClientConnectionError,
+        aiohttp.ClientPayloadError,
+        asyncio.TimeoutError
+    ))
+
+
+class _ResponseUnavailable(Exception):
+    pass
+
+
+_CATEGORY_LIST_LOCKS: Dict[str, threading.Lock] = {}
+_CATEGORY_LISTS: Dict[str, Tuple[Dict, ...]] = {}
 
 
 def get_category_list(lang_code_id: str = "en", retry_count: int = 5, retry_delay: float = 1.0) -> List[Dict]:
+    categories = _CATEGORY_LISTS.get(lang_code_id)
+    if categories is None:
+        with _CATEGORY_LIST_LOCKS.setdefault(lang_code_id, threading.Lock()):
+            categories = _CATEGORY_LISTS.get(lang_code_id)
+            if categories is None:
+                fetched = _get_category_list_impl(lang_code_id, retry_count, retry_delay)
+                if not fetched:
+                    return []
+                categories = _CATEGORY_LISTS[lang_code_id] = tuple(fetched)
+    return list(categories)
+
+
+def clear_category_cache() -> None:
+    _CATEGORY_LISTS.clear()
+
+
+def _get_category_list_impl(lang_code_id: str = "en", retry_count: int = 5, retry_delay: float = 1.0) -> List[Dict]:
     url = f"{VISIT_SEOUL_BASE_URL}/category/list"
-    headers = get_api_headers()
+    session = _get_session(retry_count, retry_delay)
     
-    for attempt in range(retry_count):
-        try:
-            logger.info(f"Fetching category list (lang: {lang_code_id}, attempt: {attempt + 1})")
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get("result_code") == 200 and "data" in data:
-                categories = data["data"]
-                logger.info(f"Found {len(categories)} categories")
-                return categories
-            else:
-                logger.error(f"Unexpected response: {data}")
-                return []
+    cache_key = _response_cache_key(url, lang_code_id.encode())
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        logger.info("Using cached category list (lang: %s, %d categories)", lang_code_id, len(cached))
+        return cached
+    
+    try:
+        logger.info("Fetching category list (lang: %s)", lang_code_id)
+        response = session.get(url, timeout=30)
+        response.raise_for_status()
         
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"Request failed (attempt {attempt + 1}/{retry_count}): {e}")
-            if attempt < retry_count - 1:
-                time.sleep(retry_delay * (attempt + 1))
-            else:
-                logger.error(f"Failed to fetch categories after {retry_count} attempts")
-                return []
+        data = _loads(response)
         
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}", exc_info=True)
+        if data.get("result_code") == 200 and "data" in data:
+            categories = data["data"]
+            logger.info("Found %d categories", len(categories))
+            _cache_set(cache_key, categories)
+            return categories
+        else:
+            logger.error("Unexpected response: %s", data)
             return []
     
-    return []
+    except requests.exceptions.RequestException as e:
+        logger.error("Failed to fetch categories: %s", e)
+        return []
+    
+    except Exception as e:
+        logger.error("Unexpected error: %s", e, exc_info=True)
+        return []
 
 
 def map_category_to_visit_seoul_sn(
@@ -208,34 +531,35 @@ def map_category_to_visit_seoul_sn(
     retry_count: int = 5,
     retry_delay: float = 1.0
 ) -> Optional[List[str]]:
+    is_english = lang_code_id == "en"
+    compiled = _COMPILED_CATEGORY_MATCHERS.get(category)
+    matcher = (compiled.en if is_english else compiled.ko) if compiled else None
+    if not matcher:
+        logger.warning("Unknown category: %s", category)
+        return None
+    
     categories = get_category_list(lang_code_id, retry_count, retry_delay)
     if not categories:
-        logger.warning(f"Could not fetch VISIT SEOUL categories, returning None for {category}")
+        logger.warning("Could not fetch VISIT SEOUL categories, returning None for %s", category)
         return None
     
-    category_info = CATEGORY_DATASET_INFO.get(category, {})
-    
-    is_english = lang_code_id == "en"
-    if is_english:
-        include_paths = [normalize_category_path(p) for p in category_info.get("include_paths_en", [])]
-        include_prefixes = [normalize_category_path(p) for p in category_info.get("include_prefixes_en", [])]
-        include_keywords = category_info.get("include_keywords_en", [])
-        exclude_keywords = category_info.get("exclude_keywords_en", [])
-    else:
-        include_paths = [normalize_category_path(p) for p in category_info.get("include_paths", [])]
-        include_prefixes = [normalize_category_path(p) for p in category_info.get("include_prefixes", [])]
-        include_keywords = category_info.get("include_keywords") or []
-        exclude_keywords = category_info.get("exclude_keywords", [])
-    
-    if not include_paths and not include_keywords and not include_prefixes:
-        logger.warning(f"Unknown category: {category}")
-        return None
+    path_to_categories = _PATH_TO_CATEGORIES[is_english]
+    normalized_include_paths = matcher.include_paths
+    include_path_segments = matcher.include_path_segments
+    descendant_prefixes = matcher.descendant_prefixes
+    include_prefixes = matcher.include_prefixes
+    include_prefix_tuple = matcher.include_prefix_tuple
+    include_keywords = matcher.include_keywords
+    include_keywords_lower = matcher.include_keywords_lower
+    include_automaton = matcher.include_automaton
+    exclude_keywords = matcher.exclude_keywords
+    exclude_automaton = matcher.exclude_automaton
     
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     matched_category_sns: List[str] = []
+    matched_set: Set[str] = set()
     matched_paths: Set[str] = set()
     
-    normalized_include_paths = [normalize_category_path(p) for p in include_paths] if include_paths else []
-    
     for cat in categories:
         ctgry_nm = cat.get("ctgry_nm", "").strip()
         ctgry_path_raw = cat.get("ctgry_path") or ctgry_nm
@@ -245,64 +569,40 @@ def map_category_to_visit_seoul_sn(
         if not category_sn:
             continue
         
-        if any(ex_keyword in ctgry_nm or ex_keyword in ctgry_path for ex_keyword in exclude_keywords):
+        match_text = f"{ctgry_nm} | {ctgry_path}"
+        if exclude_keywords and _contains_any_keyword(match_text, exclude_keywords, exclude_automaton):
             continue
         
-        path_match = ctgry_path in normalized_include_paths if normalized_include_paths else False
-        
-        path_prefix_match = False
-        if normalized_include_paths:
-            for include_path in normalized_include_paths:
-                if ctgry_path == include_path or ctgry_path.startswith(include_path + " > "):
-                    path_prefix_match = True
-                    break
-                include_segments = [s.strip().lower() for s in include_path.split(" > ")]
-                path_segments = [s.strip().lower() for s in ctgry_path.split(" > ")]
-                if len(include_segments) <= len(path_segments):
-                    match = True
-                    for i, include_seg in enumerate(include_segments):
-                        if i >= len(path_segments):
-                            match = False
-                            break
-                        if (include_seg not in path_segments[i] and 
-                            path_segments[i] not in include_seg and
-                            not any(keyword.lower() in path_segments[i] for keyword in include_seg.split() if len(keyword) > 3)):
-                            match = False
-                            break
-                    if match:
-                        path_prefix_match = True
-                        break
-        
-        prefix_match = any(
-            ctgry_path.startswith(prefix) or ctgry_path.startswith(prefix + " > ")
-            for prefix in include_prefixes
-            if prefix
-        ) if include_prefixes else False
+        matched = category in path_to_categories.get(ctgry_path, ())
+        if not matched and descendant_prefixes:
+            matched = ctgry_path.startswith(descendant_prefixes)
+        if not matched and include_prefix_tuple:
+            matched = ctgry_path.startswith(include_prefix_tuple)
+        if not matched:
+            ctgry_path_lower = ctgry_path.lower()
+            if include_keywords_lower:
+                matched = _contains_any_keyword(
+                    f"{ctgry_nm.lower()} | {ctgry_path_lower}", include_keywords_lower, include_automaton
+                )
+            if not matched and include_path_segments:
+                matched = _fuzzy_path_match(ctgry_path_lower.split(" > "), include_path_segments)
         
-        keyword_match = False
-        if include_keywords:
-            for keyword in include_keywords:
-                keyword_lower = keyword.lower()
-                if (keyword_lower in ctgry_nm.lower() or 
-                    keyword_lower in ctgry_path.lower() or
-                    any(keyword_lower in segment.lower() for segment in ctgry_path.split(" > "))):
-                    keyword_match = True
-                    break
-        
-        if not (path_match or path_prefix_match or prefix_match or keyword_match):
+        if not matched:
             continue
         
         sn_str = str(category_sn)
-        if sn_str not in matched_category_sns:
+        if sn_str not in matched_set:
+            matched_set.add(sn_str)
             matched_category_sns.append(sn_str)
             matched_paths.add(ctgry_path)
-            logger.debug(
-                "Matched category '%s' with VISIT SEOUL category_sn '%s' (name: %s, path: %s)",
-                category,
-                sn_str,
-                ctgry_nm,
-                ctgry_path
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Matched category '%s' with VISIT SEOUL category_sn '%s' (name: %s, path: %s)",
+                    category,
+                    sn_str,
+                    ctgry_nm,
+                    ctgry_path
+                )
     
     if matched_category_sns:
         logger.info(
@@ -311,17 +611,18 @@ def map_category_to_visit_seoul_sn(
             len(matched_category_sns),
             matched_category_sns
         )
-        logger.info(
-            "Matched paths for '%s': %s",
-            category,
-            sorted(matched_paths)
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Matched paths for '%s': %s",
+                category,
+                sorted(matched_paths)
+            )
         return matched_category_sns
     
-    logger.warning(f"Could not find matching VISIT SEOUL category for category: {category}")
-    logger.warning(f"  Searched paths: {normalized_include_paths}")
-    logger.warning(f"  Searched prefixes: {include_prefixes}")
-    logger.warning(f"  Searched keywords: {include_keywords[:5]}...")
+    logger.warning("Could not find matching VISIT SEOUL category for category: %s", category)
+    logger.warning("  Searched paths: %s", normalized_include_paths)
+    logger.warning("  Searched prefixes: %s", include_prefixes)
+    logger.warning("  Searched keywords: %s...", include_keywords[:5])
     return None
 
 
@@ -335,119 +636,202 @@ def search_places_by_category(
     retry_delay: float = 1.0
 ) -> Dict:
     url = f"{VISIT_SEOUL_BASE_URL}/contents/list"
-    headers = get_api_headers()
-    headers["Content-Type"] = "application/json;charset=UTF-8"
-    
-    payload = {
-        "lang_code_id": lang_code_id,
-        "sort_type": sort_type,
-        "page_no": page_no
-    }
+    session = _get_session(retry_count, retry_delay)
     
-    if category:
-        payload["com_ctgry_sn"] = category
+    body = _places_payload(lang_code_id, sort_type, page_no, category, keyword)
     
-    if keyword:
-        payload["keyword"] = keyword
-    
-    for attempt in range(retry_count):
-        try:
-            category_desc = category if category else "all categories"
-            logger.info(f"Fetching VISIT SEOUL places (category: {category_desc}, page: {page_no}, attempt: {attempt + 1})")
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get("result_code") == 200:
-                places = data.get("data", [])
-                paging = data.get("paging", {})
-                logger.info(f"Found {len(places)} places (page {page_no}, total: {paging.get('total_count', 0)})")
-                return data
-            else:
-                logger.error(f"API error: {data.get('result_message', 'Unknown error')}")
-                return {
-                    "data": [],
-                    "paging": {"page_no": page_no, "page_size": 50, "total_count": 0},
-                    "result_code": data.get("result_code", -1),
-                    "result_message": data.get("result_message", "Unknown error")
-                }
+    try:
+        logger.info("Fetching VISIT SEOUL places (category: %s, page: %d)", category or "all categories", page_no)
+        response = session.post(url, headers=_JSON_CONTENT_TYPE, data=body, timeout=30)
+        response.raise_for_status()
         
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"Request failed (attempt {attempt + 1}/{retry_count}): {e}")
-            if attempt < retry_count - 1:
-                time.sleep(retry_delay * (attempt + 1))
-            else:
-                logger.error(f"Failed to fetch places after {retry_count} attempts")
-                return {
-                    "data": [],
-                    "paging": {"page_no": page_no, "page_size": 50, "total_count": 0},
-                    "result_code": -1,
-                    "result_message": str(e)
-                }
+        data = _loads(response)
         
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}", exc_info=True)
-            return {
-                "data": [],
-                "paging": {"page_no": page_no, "page_size": 50, "total_count": 0},
-                "result_code": -1,
-                "result_message": str(e)
-            }
+        if data.get("result_code") == 200:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Found %d places (page %d, total: %s)",
+                    len(data.get("data", [])),
+                    page_no,
+                    data.get("paging", {}).get("total_count", 0)
+                )
+            return data
+        else:
+            logger.error("API error: %s", data.get("result_message", "Unknown error"))
+            return _empty_places_result(
+                page_no,
+                data.get("result_code", -1),
+                data.get("result_message", "Unknown error")
+            )
     
-    return {
-        "data": [],
-        "paging": {"page_no": page_no, "page_size": 50, "total_count": 0},
-        "result_code": -1,
-        "result_message": "Failed after retries"
-    }
+    except requests.exceptions.RequestException as e:
+        logger.error("Failed to fetch places (page %s): %s", page_no, e)
+        return _empty_places_result(page_no, -1, str(e))
+    
+    except Exception as e:
+        logger.error("Unexpected error: %s", e, exc_info=True)
+        return _empty_places_result(page_no, -1, str(e))
 
 
 def get_place_detail(
     cid: str,
     retry_count: int = 5,
     retry_delay: float = 1.0
+) -> Optional[Dict]:
+    try:
+        return _get_place_detail_cached(cid, retry_count, retry_delay)
+    except _ResponseUnavailable:
+        return None
+
+
+def clear_place_detail_cache() -> None:
+    _get_place_detail_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=8192)
+def _get_place_detail_cached(cid: str, retry_count: int, retry_delay: float) -> Dict:
+    detail = _get_place_detail_impl(cid, retry_count, retry_delay)
+    if detail is None:
+        raise _ResponseUnavailable(cid)
+    return detail
+
+
+def _get_place_detail_impl(
+    cid: str,
+    retry_count: int = 5,
+    retry_delay: float = 1.0
 ) -> Optional[Dict]:
     url = f"{VISIT_SEOUL_BASE_URL}/contents/info"
-    headers = get_api_headers()
-    headers["Content-Type"] = "application/json;charset=UTF-8"
+    session = _get_session(retry_count, retry_delay)
     
-    payload = {
-        "cid": cid
-    }
+    body = _json_dumps({"cid": cid})
     
-    for attempt in range(retry_count):
-        try:
-            logger.info(f"Fetching VISIT SEOUL place detail (cid: {cid}, attempt: {attempt + 1})")
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get("result_code") == 200 and "data" in data:
-                detail = data["data"]
-                logger.info(f"Found detail for cid: {cid}")
-                return detail
-            else:
-                logger.warning(f"No detail found for cid: {cid}, result_code: {data.get('result_code')}")
-                return None
+    cache_key = _response_cache_key(url, body)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        logger.debug("Using cached place detail (cid: %s)", cid)
+        return cached
+    
+    try:
+        logger.info("Fetching VISIT SEOUL place detail (cid: %s)", cid)
+        response = session.post(url, headers=_JSON_CONTENT_TYPE, data=body, timeout=30)
+        response.raise_for_status()
         
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"Detail request failed (attempt {attempt + 1}/{retry_count}): {e}")
-            if attempt < retry_count - 1:
-                time.sleep(retry_delay * (attempt + 1))
-            else:
-                logger.error(f"Failed to fetch place detail after {retry_count} attempts")
-                return None
+        data = _loads(response)
         
-        except Exception as e:
-            logger.error(f"Unexpected error in get_place_detail: {e}", exc_info=True)
+        if data.get("result_code") == 200 and "data" in data:
+            detail = data["data"]
+            logger.info("Found detail for cid: %s", cid)
+            _cache_set(cache_key, detail)
+            return detail
+        else:
+            logger.warning("No detail found for cid: %s, result_code: %s", cid, data.get("result_code"))
             return None
     
-    return None
+    except requests.exceptions.RequestException as e:
+        logger.error("Failed to fetch place detail (cid: %s): %s", cid, e)
+        return None
+    
+    except Exception as e:
+        logger.error("Unexpected error in _get_place_detail_impl: %s", e, exc_info=True)
+        return None
+
+
+class _RateLimiter:
+    """Spaces calls at least ``interval`` seconds apart across threads."""
+    
+    def __init__(self, interval: float):
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+    
+    def wait(self) -> None:
+        if self._interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_at - now
+            self._next_at = max(now, self._next_at) + self._interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+def get_place_details_bulk(
+    cids: List[str],
+    max_workers: int = 4,
+    min_interval: float = 0.0,
+    retry_count: int = 5,
+    retry_delay: float = 1.0
+) -> Dict[str, Optional[Dict]]:
+    details: Dict[str, Optional[Dict]] = {}
+    unique_cids = list(dict.fromkeys(cid for cid in cids if cid))
+    if not unique_cids:
+        return details
+    
+    logger.info(
+        "Fetching %d VISIT SEOUL place details with %d workers (min interval %.2fs)",
+        len(unique_cids),
+        max_workers,
+        min_interval
+    )
+    
+    rate_limiter = _RateLimiter(min_interval)
+    
+    def fetch(cid: str) -> Optional[Dict]:
+        rate_limiter.wait()
+        return get_place_detail(cid, retry_count, retry_delay)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fetch, cid): cid for cid in unique_cids}
+        for future in as_completed(futures):
+            cid = futures[future]
+            try:
+                details[cid] = future.result()
+            except Exception as e:
+                logger.error("Detail fetch failed for cid %s: %s", cid, e, exc_info=True)
+                details[cid] = None
+    
+    logger.info(f"Fetched {sum(1 for d in details.values() if d)}/{len(unique_cids)} place details")
+    return details
+
+
+@dataclass(slots=True)
+class VisitSeoulPlace:
+    content_id: Optional[str] = None
+    content_type_id: Optional[str] = None
+    name: Optional[str] = None
+    category: Optional[str] = None
+    lang_code_id: Optional[str] = None
+    cate_depth: List[str] = field(default_factory=list)
+    multi_lang_list: Optional[List] = None
+    tags: List[str] = field(default_factory=list)
+    schedule: Dict = field(default_factory=dict)
+    traffic: Dict = field(default_factory=dict)
+    extra: Dict = field(default_factory=dict)
+    tourist: Dict = field(default_factory=dict)
+    address: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    image_url: Optional[str] = None
+    images: List[str] = field(default_factory=list)
+    overview: Optional[str] = None
+    content: Optional[str] = None
+    homepage: Optional[str] = None
+    tel: Optional[str] = None
+    usage_info: Optional[str] = None
+    tip: Optional[str] = None
+    detail_info: Dict = field(default_factory=dict)
+    category_label: Optional[str] = None
+    raw_data: Optional[Dict] = None
+    
+    def to_dict(self) -> Dict:
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        if data["raw_data"] is None:
+            del data["raw_data"]
+        return data
 
 
-def parse_visit_seoul_place(item: Dict, detail: Optional[Dict] = None) -> Dict:
+def parse_visit_seoul_place(item: Dict, detail: Optional[Dict] = None, keep_raw: bool = False) -> VisitSeoulPlace:
     data = detail if detail else item
     lang_code_id = data.get("lang_code_id") or item.get("lang_code_id")
     cate_depth_raw = data.get("cate_depth") or item.get("cate_depth") or []
@@ -463,10 +847,12 @@ def parse_visit_seoul_place(item: Dict, detail: Optional[Dict] = None) -> Dict:
     extra_data: Dict = {}
     tourist_data: Dict = {}
     
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     cid = data.get("cid") or item.get("cid")
-    logger.debug(f"Parsing VISIT SEOUL place - CID: {cid}")
-    logger.debug(f"Item keys: {list(item.keys()) if item else 'None'}")
-    logger.debug(f"Detail keys: {list(detail.keys()) if detail else 'None'}")
+    if debug_enabled:
+        logger.debug("Parsing VISIT SEOUL place - CID: %s", cid)
+        logger.debug("Item keys: %s", list(item.keys()) if item else "None")
+        logger.debug("Detail keys: %s", list(detail.keys()) if detail else "None")
     
     latitude = None
     longitude = None
@@ -538,8 +924,9 @@ def parse_visit_seoul_place(item: Dict, detail: Optional[Dict] = None) -> Dict:
             tel = extra_data.get("cmmn_telno")
             tip = extra_data.get("cmmn_tip") or extra_data.get("tip")
             
-            logger.debug(f"Extra keys: {list(extra_data.keys()) if extra_data else 'None'}")
-            logger.debug(f"Homepage: {homepage}, Tel: {tel}, Tip: {tip}")
+            if debug_enabled:
+                logger.debug("Extra keys: %s", list(extra_data.keys()))
+                logger.debug("Homepage: %s, Tel: %s, Tip: %s", homepage, tel, tip)
             
             detail_info = {
                 "opening_hours": extra_data.get("cmmn_use_time") or "",
@@ -570,109 +957,400 @@ def parse_visit_seoul_place(item: Dict, detail: Optional[Dict] = None) -> Dict:
     else:
         overview = item.get("sumry")
         content = overview
-        logger.debug(f"Using item data - overview: {overview[:100] if overview else 'None'}...")
+        if debug_enabled:
+            logger.debug("Using item data - overview: %s...", overview[:100] if overview else "None")
     
     category_sn = data.get("com_ctgry_sn") or item.get("com_ctgry_sn")
     
-    parsed_data = {
-        "content_id": data.get("cid") or item.get("cid"),
-        "content_type_id": None,
-        "name": data.get("post_sj") or item.get("post_sj"),
-        "category": category_sn,
-        "lang_code_id": lang_code_id,
-        "cate_depth": cate_depth,
-        "multi_lang_list": multi_lang_list,
-        "tags": tags,
-        "schedule": schedule,
-        "traffic": traffic_data,
-        "extra": extra_data,
-        "tourist": tourist_data,
-        "address": address,
-        "latitude": latitude,
-        "longitude": longitude,
-        "image_url": image_url,
-        "images": images,
-        "overview": overview or item.get("sumry"),
-        "content": content,
-        "homepage": homepage,
-        "tel": tel,
-        "usage_info": usage_info,
-        "tip": tip,
-        "detail_info": detail_info,
-        "raw_data": {
-            "item": item,
-            "detail": detail
-        }
-    }
+    parsed_data = VisitSeoulPlace(
+        content_id=data.get("cid") or item.get("cid"),
+        content_type_id=None,
+        name=data.get("post_sj") or item.get("post_sj"),
+        category=category_sn,
+        lang_code_id=lang_code_id,
+        cate_depth=cate_depth,
+        multi_lang_list=multi_lang_list,
+        tags=tags,
+        schedule=schedule,
+        traffic=traffic_data,
+        extra=extra_data,
+        tourist=tourist_data,
+        address=address,
+        latitude=latitude,
+        longitude=longitude,
+        image_url=image_url,
+        images=images,
+        overview=overview or item.get("sumry"),
+        content=content,
+        homepage=homepage,
+        tel=tel,
+        usage_info=usage_info,
+        tip=tip,
+        detail_info=detail_info,
+        raw_data={"item": item, "detail": detail} if keep_raw else None
+    )
     
-    logger.info(f"Parsed place - Name: {parsed_data['name']}, Content: {bool(content)}, Detail_info keys: {list(detail_info.keys())}, category_sn: {category_sn}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Parsed place - Name: %s, Content: %s, Detail_info keys: %s, category_sn: %s",
+            parsed_data.name,
+            bool(content),
+            list(detail_info.keys()),
+            category_sn
+        )
     
     return parsed_data
 
 
+def parse_visit_seoul_places(
+    items: Iterable[Dict],
+    details_by_cid: Dict[str, Optional[Dict]],
+    category_label: Optional[str] = None,
+    keep_raw: bool = False
+) -> Iterator[VisitSeoulPlace]:
+    """Convenience wrapper that runs parse_visit_seoul_place over each item, skipping bad ones."""
+    for idx, item in enumerate(items):
+        cid = (
+            item.get("cid")
+            or item.get("contentId")
+            or item.get("content_id")
+            or item.get("id")
+        )
+        if not cid:
+            logger.warning("Skipping VISIT SEOUL item %d: missing cid", idx + 1)
+            continue
+        
+        try:
+            place = parse_visit_seoul_place(item, details_by_cid.get(cid), keep_raw)
+        except Exception as e:
+            logger.error("Error parsing VISIT SEOUL item %d (cid: %s): %s", idx + 1, cid, e, exc_info=True)
+            continue
+        
+        place.category_label = category_label
+        yield place
+
+
 def collect_all_places_by_category(
     category_sn: Optional[str] = None,
     lang_code_id: str = "en",
     max_places: Optional[int] = None,
     delay_between_pages: float = 1.0
 ) -> List[Dict]:
-    all_places: List[Dict] = []
+    return list(iter_places_by_category(category_sn, lang_code_id, max_places, delay_between_pages))
+
+
+def iter_places_by_category(
+    category_sn: Optional[str] = None,
+    lang_code_id: str = "en",
+    max_places: Optional[int] = None,
+    delay_between_pages: float = 1.0
+) -> Iterator[Dict]:
+    collected = 0
     seen_cids: Set[str] = set()
     page_no = 1
+    last_page: Optional[int] = None
     limit_desc = max_places if max_places else "ALL"
     
     category_desc = category_sn if category_sn else "all categories"
     logger.info(f"Starting VISIT SEOUL collection for category: {category_desc}, target: {limit_desc}")
     
-    while True:
-        result = search_places_by_category(
+    def fetch_page(page: int, delay: float = 0.0) -> Dict:
+        if delay > 0:
+            time.sleep(delay)
+        return search_places_by_category(
             category=category_sn,
             lang_code_id=lang_code_id,
-            page_no=page_no
+            page_no=page
         )
+    
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        next_future = executor.submit(fetch_page, page_no)
         
-        places = result.get("data", [])
-        paging = result.get("paging", {})
-        
-        if not places:
-            logger.info(f"No more places found at page {page_no}")
-            break
-        
-        page_size = paging.get("page_size", 50)
-        total_count = paging.get("total_count")
-        
-        for place in places:
-            cid = (
-                place.get("cid")
-                or place.get("contentId")
-                or place.get("content_id")
-                or place.get("id")
-            )
-            if cid and cid in seen_cids:
-                continue
+        while next_future is not None:
+            result = next_future.result()
+            next_future = None
             
-            if cid:
-                seen_cids.add(cid)
+            places = result.get("data", [])
+            paging = _paging_from(result)
             
-            all_places.append(place)
+            if not places:
+                logger.info(f"No more places found at page {page_no}")
+                break
             
-            if max_places and len(all_places) >= max_places:
-                logger.info(f"Reached requested max_places ({max_places}) for category {category_desc}")
-                return all_places
-        
-        logger.info(
-            "Collected %d places so far (page %d, total reported: %s)",
-            len(all_places),
-            page_no,
-            total_count if total_count is not None else "unknown"
+            page_size = paging.page_size or 50
+            total_count = paging.total_count
+            if last_page is None and total_count and page_size:
+                last_page = math.ceil(total_count / page_size)
+            has_more = len(places) >= page_size and (last_page is None or page_no < last_page)
+            
+            if has_more and not (max_places and collected + len(places) >= max_places):
+                next_future = executor.submit(fetch_page, page_no + 1, delay_between_pages)
+            
+            for place in places:
+                cid = (
+                    place.get("cid")
+                    or place.get("contentId")
+                    or place.get("content_id")
+                    or place.get("id")
+                )
+                if cid and cid in seen_cids:
+                    continue
+                
+                if cid:
+                    seen_cids.add(cid)
+                
+                yield place
+                collected += 1
+                
+                if max_places and collected >= max_places:
+                    logger.info(f"Reached requested max_places ({max_places}) for category {category_desc}")
+                    return
+            
+            logger.info(
+                "Collected %d places so far (page %d, total reported: %s)",
+                collected,
+                page_no,
+                total_count if total_count is not None else "unknown"
+            )
+            
+            if has_more and next_future is None:
+                next_future = executor.submit(fetch_page, page_no + 1, delay_between_pages)
+            
+            page_no += 1
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    logger.info(f"Total collected: {collected} places for category {category_desc}")
+
+
+@dataclass(frozen=True, slots=True)
+class PagingInfo:
+    page_no: int = 1
+    page_size: Optional[int] = None
+    total_count: Optional[int] = None
+
+
+def _paging_from(result: Dict) -> PagingInfo:
+    paging = result.get("paging") or {}
+    return PagingInfo(
+        page_no=paging.get("page_no") or 1,
+        page_size=paging.get("page_size"),
+        total_count=paging.get("total_count")
+    )
+
+
+def _empty_places_result(page_no: int, result_code: int = -1, result_message: str = "Unknown error") -> Dict:
+    return {
+        "data": [],
+        "paging": {"page_no": page_no, "page_size": 50, "total_count": 0},
+        "result_code": result_code,
+        "result_message": result_message
+    }
+
+
+def _log_async_retry(retry_state: RetryCallState) -> None:
+    logger.warning(
+        "Async VISIT SEOUL request failed (attempt %d), retrying: %s",
+        retry_state.attempt_number,
+        retry_state.outcome.exception()
+    )
+
+
+def _async_retrying(retry_count: int, retry_delay: float) -> AsyncRetrying:
+    return AsyncRetrying(
+        reraise=True,
+        stop=stop_after_attempt(retry_count),
+        wait=wait_random_exponential(multiplier=retry_delay, max=ASYNC_RETRY_MAX_WAIT),
+        retry=retry_if_exception(_is_retryable_error),
+        before_sleep=_log_async_retry
+    )
+
+
+async def search_places_by_category_async(
+    session: aiohttp.ClientSession,
+    category: Optional[str] = None,
+    lang_code_id: str = "en",
+    keyword: Optional[str] = None,
+    sort_type: str = "latest",
+    page_no: int = 1,
+    retry_count: int = 5,
+    retry_delay: float = 1.0,
+    semaphore: Optional[asyncio.Semaphore] = None
+) -> Dict:
+    url = f"{VISIT_SEOUL_BASE_URL}/contents/list"
+    headers = _cached_headers(json_body=True)
+    
+    body = _places_payload(lang_code_id, sort_type, page_no, category, keyword)
+    
+    limiter = semaphore if semaphore is not None else contextlib.nullcontext()
+    
+    try:
+        async for attempt in _async_retrying(retry_count, retry_delay):
+            with attempt:
+                async with limiter:
+                    logger.info(
+                        "Fetching VISIT SEOUL places async (category: %s, page: %d, attempt: %d)",
+                        category or "all categories",
+                        page_no,
+                        attempt.retry_state.attempt_number
+                    )
+                    async with session.post(url, headers=headers, data=body) as response:
+                        response.raise_for_status()
+                        data = _json_loads(await response.read())
+    
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.error("Failed to fetch places (page %s): %s", page_no, e)
+        return _empty_places_result(page_no, -1, str(e))
+    
+    except Exception as e:
+        logger.error("Unexpected error: %s", e, exc_info=True)
+        return _empty_places_result(page_no, -1, str(e))
+    
+    if data.get("result_code") == 200:
+        return data
+    
+    logger.error("API error: %s", data.get("result_message", "Unknown error"))
+    return _empty_places_result(
+        page_no,
+        data.get("result_code", -1),
+        data.get("result_message", "Unknown error")
+    )
+
+
+async def collect_all_places_by_category_async(
+    category_sn: Optional[str] = None,
+    lang_code_id: str = "en",
+    max_places: Optional[int] = None,
+    concurrency: int = 10
+) -> List[Dict]:
+    category_desc = category_sn if category_sn else "all categories"
+    logger.info(f"Starting async VISIT SEOUL collection for category: {category_desc}, target: {max_places or 'ALL'}")
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(
+        limit=min(concurrency, ASYNC_CONNECTION_LIMIT),
+        keepalive_timeout=ASYNC_KEEPALIVE_TIMEOUT
+    )
+    timeout = aiohttp.ClientTimeout(total=30)
+    
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        first_page = await search_places_by_category_async(
+            session,
+            category=category_sn,
+            lang_code_id=lang_code_id,
+            page_no=1,
+            semaphore=semaphore
         )
         
-        if not places or len(places) < page_size:
-            break
+        first_places = first_page.get("data") or []
+        if not first_places:
+            logger.info(f"No places found for category {category_desc}")
+            return []
+        
+        paging = _paging_from(first_page)
+        page_size = paging.page_size or 50
+        total_count = paging.total_count
+        
+        all_places: List[Dict] = []
+        seen_cids: Set[str] = set()
+        
+        def add_places(places: List[Dict]) -> bool:
+            for place in places:
+                cid = (
+                    place.get("cid")
+                    or place.get("contentId")
+                    or place.get("content_id")
+                    or place.get("id")
+                )
+                if cid and cid in seen_cids:
+                    continue
+                
+                if cid:
+                    seen_cids.add(cid)
+                
+                all_places.append(place)
+                
+                if max_places and len(all_places) >= max_places:
+                    logger.info(f"Reached requested max_places ({max_places}) for category {category_desc}")
+                    return True
+            return False
+        
+        if add_places(first_places):
+            return all_places
         
-        page_no += 1
-        time.sleep(delay_between_pages)
+        def fetch_page(page_no: int):
+            return search_places_by_category_async(
+                session,
+                category=category_sn,
+                lang_code_id=lang_code_id,
+                page_no=page_no,
+                semaphore=semaphore
+            )
+        
+        if total_count:
+            last_page = math.ceil(total_count / page_size)
+            if max_places:
+                last_page = min(last_page, math.ceil(max_places / page_size))
+            
+            if last_page > 1:
+                logger.info(f"Fetching pages 2-{last_page} concurrently (total reported: {total_count})")
+                page_nos = list(range(2, last_page + 1))
+                results = dict(zip(page_nos, await asyncio.gather(*map(fetch_page, page_nos))))
+                
+                failed_pages = [page_no for page_no, result in results.items() if result.get("result_code") != 200]
+                if failed_pages:
+                    logger.warning(
+                        "%d page(s) failed for category %s, retrying: %s",
+                        len(failed_pages),
+                        category_desc,
+                        failed_pages
+                    )
+                    results.update(zip(failed_pages, await asyncio.gather(*map(fetch_page, failed_pages))))
+                    failed_pages = [page_no for page_no in failed_pages if results[page_no].get("result_code") != 200]
+                    if failed_pages:
+                        logger.error(
+                            "Giving up on %d page(s) for category %s; results are incomplete: %s",
+                            len(failed_pages),
+                            category_desc,
+                            failed_pages
+                        )
+                
+                for page_no in page_nos:
+                    if add_places(results[page_no].get("data") or []):
+                        return all_places
+        else:
+            # Without a reported total, page sequentially until a short page, like iter_places_by_category
+            page_no = 1
+            places = first_places
+            while len(places) >= page_size:
+                page_no += 1
+                result = await fetch_page(page_no)
+                if result.get("result_code") != 200:
+                    logger.error(
+                        "Page %d failed for category %s (%s); stopping with incomplete results",
+                        page_no,
+                        category_desc,
+                        result.get("result_message")
+                    )
+                    break
+                places = result.get("data") or []
+                if add_places(places):
+                    return all_places
     
-    category_desc = category_sn if category_sn else "all categories"
     logger.info(f"Total collected: {len(all_places)} places for category {category_desc}")
     return all_places
+
+
+def collect_all_places_by_category_concurrent(
+    category_sn: Optional[str] = None,
+    lang_code_id: str = "en",
+    max_places: Optional[int] = None,
+    concurrency: int = 10
+) -> List[Dict]:
+    return asyncio.run(collect_all_places_by_category_async(
+        category_sn=category_sn,
+        lang_code_id=lang_code_id,
+        max_places=max_places,
+        concurrency=concurrency
+    ))
@@ -1,34 +1,137 @@
 """VLM Service"""
 
 import os
+import re
 import base64
+import asyncio
+import contextlib
+import functools
+import hashlib
 import logging
-from typing import Optional, Dict, List
+import threading
+from typing import Optional, Dict, List, Tuple
 from io import BytesIO
+from itertools import islice
 from PIL import Image
+from cachetools import TTLCache
+from tenacity import RetryCallState, retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 
 logger = logging.getLogger(__name__)
 
-openai_client = None
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    pybase64 = None
+    PYBASE64_AVAILABLE = False
+
 OPENAI_AVAILABLE = False
 
 try:
-    from openai import OpenAI
-    api_key = os.getenv("OPENAI_API_KEY")
-    if api_key:
-        openai_client = OpenAI(api_key=api_key)
+    import httpx
+    import openai
+    from openai import AsyncOpenAI
+    RETRYABLE_OPENAI_ERRORS = (
+        openai.RateLimitError,
+        openai.APITimeoutError,
+        openai.APIConnectionError,
+        openai.InternalServerError
+    )
+    if os.getenv("OPENAI_API_KEY"):
         OPENAI_AVAILABLE = True
     else:
         logger.warning("OPENAI_API_KEY not set")
 except ImportError:
+    httpx = None
+    AsyncOpenAI = None
+    RETRYABLE_OPENAI_ERRORS = ()
     logger.warning("OpenAI not installed")
-except Exception as e:
-    logger.warning(f"Failed to initialize OpenAI: {e}")
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    from aiolimiter import AsyncLimiter
+    AIOLIMITER_AVAILABLE = True
+except ImportError:
+    AsyncLimiter = None
+    AIOLIMITER_AVAILABLE = False
+
+OPENAI_MAX_CONNECTIONS = 64
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = 32
+OPENAI_KEEPALIVE_EXPIRY = 300.0
+OPENAI_TIMEOUT = 60.0
+OPENAI_CONNECT_TIMEOUT = 5.0
+VLM_MODEL = "gpt-4o-mini"
+VLM_IMAGE_MAX_SIZE = 768
+VLM_IMAGE_DETAIL = "low"
+VLM_JPEG_QUALITY = 82
+VLM_PASSTHROUGH_MAX_BYTES = 200_000
+JPEG_MAGIC = b'\xff\xd8\xff'
+VLM_MAX_CONCURRENCY = int(os.getenv("VLM_MAX_CONCURRENCY", "16"))
+VLM_RPS = float(os.getenv("VLM_RPS", "10"))
+VLM_RETRY_ATTEMPTS = 4
+VLM_RETRY_MAX_WAIT = 16
+VLM_CACHE_MAXSIZE = 1024
+VLM_CACHE_TTL = 3600
+
+_vlm_loop_limits: Dict[asyncio.AbstractEventLoop, Tuple[asyncio.Semaphore, Optional["AsyncLimiter"]]] = {}
+_vlm_cache: TTLCache = TTLCache(maxsize=VLM_CACHE_MAXSIZE, ttl=VLM_CACHE_TTL)
+_vlm_cache_lock = threading.Lock()
+
+
+def _build_http_client_kwargs() -> Dict:
+    return {
+        "http2": HTTP2_AVAILABLE,
+        "limits": httpx.Limits(
+            max_connections=OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=OPENAI_KEEPALIVE_EXPIRY
+        ),
+        "timeout": httpx.Timeout(OPENAI_TIMEOUT, connect=OPENAI_CONNECT_TIMEOUT)
+    }
 
 
-def compress_image(image_bytes: bytes, max_size: int = 1024) -> bytes:
+@functools.lru_cache(maxsize=1)
+def get_async_client() -> "AsyncOpenAI":
+    return AsyncOpenAI(
+        api_key=os.getenv("OPENAI_API_KEY"),
+        max_retries=0,
+        http_client=httpx.AsyncClient(**_build_http_client_kwargs())
+    )
+
+
+def _get_loop_limits() -> Tuple[asyncio.Semaphore, Optional["AsyncLimiter"]]:
+    # Semaphores and limiters are bound to the loop that first uses them
+    loop = asyncio.get_running_loop()
+    limits = _vlm_loop_limits.get(loop)
+    if limits is None:
+        for closed_loop in [other for other in _vlm_loop_limits if other.is_closed()]:
+            del _vlm_loop_limits[closed_loop]
+        limits = (
+            asyncio.Semaphore(VLM_MAX_CONCURRENCY),
+            AsyncLimiter(VLM_RPS, 1.0) if AIOLIMITER_AVAILABLE else None
+        )
+        _vlm_loop_limits[loop] = limits
+    return limits
+
+
+def compress_image(image_bytes: bytes, max_size: int = VLM_IMAGE_MAX_SIZE) -> bytes:
     try:
         img = Image.open(BytesIO(image_bytes))
+        if (
+            image_bytes.startswith(JPEG_MAGIC)
+            and len(image_bytes) <= VLM_PASSTHROUGH_MAX_BYTES
+            and img.mode in ('RGB', 'L')
+            and max(img.size) <= max_size
+        ):
+            return image_bytes
+        
+        if img.format == 'JPEG':
+            img.draft('RGB', (max_size * 2, max_size * 2))
         
         if img.mode != 'RGB':
             img = img.convert('RGB')
@@ -39,7 +142,14 @@ def compress_image(image_bytes: bytes, max_size: int = 1024) -> bytes:
             img = img.resize(new_size, Image.Resampling.LANCZOS)
         
         output = BytesIO()
-        img.save(output, format='JPEG', quality=85, optimize=True)
+        img.save(
+            output,
+            format='JPEG',
+            quality=VLM_JPEG_QUALITY,
+            optimize=True,
+            progressive=True,
+            subsampling='4:2:0'
+        )
         return output.getvalue()
     
     except Exception as e:
@@ -47,41 +157,128 @@ def compress_image(image_bytes: bytes, max_size: int = 1024) -> bytes:
         return image_bytes
 
 
-def analyze_image_gpt4v(
+JPEG_DATA_URL_PREFIX = "data:image/jpeg;base64,"
+
+
+def encode_image_base64(image_bytes: bytes) -> str:
+    if PYBASE64_AVAILABLE:
+        return pybase64.b64encode_as_string(image_bytes)
+    return base64.b64encode(image_bytes).decode('ascii')
+
+
+def build_image_data_url(image_bytes: bytes) -> str:
+    return JPEG_DATA_URL_PREFIX + encode_image_base64(image_bytes)
+
+
+def _prompt_cache_key(prompt: str) -> bytes:
+    return hashlib.blake2b(" ".join(prompt.split()).encode(), digest_size=16).digest()
+
+
+def _vlm_cache_key(image_bytes: bytes, prompt: str, max_tokens: int, detail: str) -> Tuple[bytes, bytes, int, str]:
+    return (
+        hashlib.blake2b(image_bytes, digest_size=16).digest(),
+        _prompt_cache_key(prompt),
+        max_tokens,
+        detail
+    )
+
+
+def _get_cached_analysis(key: Tuple[bytes, bytes, int, str]) -> Optional[str]:
+    with _vlm_cache_lock:
+        return _vlm_cache.get(key)
+
+
+def _set_cached_analysis(key: Tuple[bytes, bytes, int, str], result: str) -> None:
+    with _vlm_cache_lock:
+        _vlm_cache[key] = result
+
+
+def clear_analysis_cache() -> None:
+    with _vlm_cache_lock:
+        _vlm_cache.clear()
+
+
+def _prepare_image(
     image_bytes: bytes,
     prompt: str,
-    max_tokens: int = 500
+    max_tokens: int,
+    detail: str
+) -> Tuple[bytes, Tuple[bytes, bytes, int, str]]:
+    compressed_image = compress_image(image_bytes)
+    return compressed_image, _vlm_cache_key(compressed_image, prompt, max_tokens, detail)
+
+
+def _vision_request(image_url: str, prompt: str, max_tokens: int, detail: str = VLM_IMAGE_DETAIL) -> Dict:
+    return {
+        "model": VLM_MODEL,
+        "messages": [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": prompt},
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": image_url,
+                            "detail": detail
+                        }
+                    }
+                ]
+            }
+        ],
+        "max_tokens": max_tokens,
+        "temperature": 0.3
+    }
+
+
+def _log_vlm_retry(retry_state: RetryCallState) -> None:
+    logger.warning(
+        "GPT-4V request failed (attempt %d), retrying: %s",
+        retry_state.attempt_number,
+        retry_state.outcome.exception()
+    )
+
+
+_vlm_retry = retry(
+    retry=retry_if_exception_type(RETRYABLE_OPENAI_ERRORS),
+    wait=wait_exponential_jitter(initial=1, max=VLM_RETRY_MAX_WAIT),
+    stop=stop_after_attempt(VLM_RETRY_ATTEMPTS),
+    before_sleep=_log_vlm_retry,
+    reraise=True
+)
+
+
+@_vlm_retry
+async def _create_completion_async(request: Dict):
+    semaphore, rate_limiter = _get_loop_limits()
+    async with semaphore, rate_limiter or contextlib.nullcontext():
+        return await get_async_client().chat.completions.create(**request)
+
+
+async def analyze_image_gpt4v_async(
+    image_bytes: bytes,
+    prompt: str,
+    max_tokens: int = 500,
+    detail: str = VLM_IMAGE_DETAIL
 ) -> Optional[str]:
     if not OPENAI_AVAILABLE:
         logger.error("OpenAI not available")
         return None
     
     try:
-        compressed_image = compress_image(image_bytes)
-        image_base64 = base64.b64encode(compressed_image).decode('utf-8')
+        compressed_image, cache_key = await asyncio.to_thread(_prepare_image, image_bytes, prompt, max_tokens, detail)
+        cached = _get_cached_analysis(cache_key)
+        if cached is not None:
+            logger.info("GPT-4V analysis served from cache")
+            return cached
         
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": prompt},
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/jpeg;base64,{image_base64}"
-                            }
-                        }
-                    ]
-                }
-            ],
-            max_tokens=max_tokens,
-            temperature=0.3
-        )
+        request = _vision_request(build_image_data_url(compressed_image), prompt, max_tokens, detail)
+        response = await _create_completion_async(request)
         
         result = response.choices[0].message.content
         logger.info(f"GPT-4V analysis complete: {len(result)} chars")
+        if result:
+            _set_cached_analysis(cache_key, result)
         return result
     
     except Exception as e:
@@ -94,6 +291,16 @@ def analyze_place_image(
     nearby_places: Optional[List[Dict]] = None,
     language: str = "en",
     quest_context: Optional[Dict] = None
+) -> Optional[str]:
+    """Synchronous entry point for scripts; must not be called from a running event loop."""
+    return asyncio.run(analyze_place_image_async(image_bytes, nearby_places, language, quest_context))
+
+
+async def analyze_place_image_async(
+    image_bytes: bytes,
+    nearby_places: Optional[List[Dict]] = None,
+    language: str = "en",
+    quest_context: Optional[Dict] = None
 ) -> Optional[str]:
     prompt = build_place_analysis_prompt(nearby_places, language, quest_context)
     
@@ -101,7 +308,7 @@ def analyze_place_image(
         logger.error("GPT-4V unavailable.")
         return None
     
-    result = analyze_image_gpt4v(image_bytes, prompt)
+    result = await analyze_image_gpt4v_async(image_bytes, prompt)
     
     if not result:
         logger.error("Image analysis failed.")
@@ -110,22 +317,7 @@ def analyze_place_image(
     return result
 
 
-def build_place_analysis_prompt(
-    nearby_places: Optional[List[Dict]] = None,
-    language: str = "en",
-    quest_context: Optional[Dict] = None
-) -> str:    
-    if quest_context:
-        from services.quest_rag import generate_quest_rag_text
-        
-        quest_place = quest_context.get("place", {})
-        quest_name = quest_context.get("name") or quest_context.get("title", "")
-        place_name = quest_place.get("name", "") if quest_place else ""
-        quest_location = place_name or quest_name
-        
-        quest_rag_text = generate_quest_rag_text(quest_context, quest_place)
-        
-        prompt = f"""You are a Seoul tourism expert. 
+QUEST_PLACE_PROMPT_TEMPLATE = """You are a Seoul tourism expert. 
 
 [IMPORTANT CONTEXT]
 This image was taken INSIDE or AT the quest location: "{quest_location}"
@@ -150,8 +342,8 @@ Category: [tourist spot/restaurant/cafe/park/historic site/feature within locati
 Description: [2-3 sentences describing the specific element and its relationship to the quest location]
 Features: [visual characteristics and special points of the element]
 Confidence: [high/medium/low]"""
-    else:
-        prompt = """You are a Seoul tourism expert. Analyze this image and provide:
+
+GENERAL_PLACE_PROMPT = """You are a Seoul tourism expert. Analyze this image and provide:
 
 1. Identify the exact place/location
 2. Describe architectural style, colors, distinctive features
@@ -164,18 +356,65 @@ Category: [tourist spot/restaurant/cafe/park/historic site, etc.]
 Description: [2-3 sentences describing the place]
 Features: [visual characteristics and special points]
 Confidence: [high/medium/low]"""
+
+NEARBY_PLACES_PROMPT_HEADER = "\n\nReference: Nearby places within 1km (GPS-based):\n"
+NEARBY_PLACES_PROMPT_FOOTER = "\n\nIf the image matches any of these candidates, prioritize them."
+NEARBY_PLACES_PROMPT_LIMIT = 5
+
+_format_nearby_place = "- {} ({}) - {:.2f}km".format
+
+
+def build_place_analysis_prompt(
+    nearby_places: Optional[List[Dict]] = None,
+    language: str = "en",
+    quest_context: Optional[Dict] = None
+) -> str:    
+    if quest_context:
+        from services.quest_rag import generate_quest_rag_text
+        
+        quest_place = quest_context.get("place", {})
+        quest_name = quest_context.get("name") or quest_context.get("title", "")
+        place_name = quest_place.get("name", "") if quest_place else ""
+        quest_location = place_name or quest_name
+        
+        quest_rag_text = generate_quest_rag_text(quest_context, quest_place)
+        
+        prompt = QUEST_PLACE_PROMPT_TEMPLATE.format(
+            quest_location=quest_location,
+            quest_rag_text=quest_rag_text
+        )
+    else:
+        prompt = GENERAL_PLACE_PROMPT
     
     if nearby_places:
-        places_text = "\n".join([
-            f"- {p.get('name', 'Unknown')} ({p.get('category', 'N/A')}) - {p.get('distance_km', 0):.2f}km"
-            for p in nearby_places[:5]
-        ])
-        prompt += f"\n\nReference: Nearby places within 1km (GPS-based):\n{places_text}\n"
-        prompt += "\nIf the image matches any of these candidates, prioritize them."
+        places_text = "\n".join(
+            _format_nearby_place(p.get('name', 'Unknown'), p.get('category', 'N/A'), p.get('distance_km', 0))
+            for p in islice(nearby_places, NEARBY_PLACES_PROMPT_LIMIT)
+        )
+        prompt = "".join((prompt, NEARBY_PLACES_PROMPT_HEADER, places_text, NEARBY_PLACES_PROMPT_FOOTER))
     
     return prompt
 
 
+_VLM_FIELD_KEYS = {
+    '장소명': "place_name",
+    'Place Name': "place_name",
+    '카테고리': "category",
+    'Category': "category",
+    '설명': "description",
+    'Description': "description",
+    '특징': "features",
+    'Features': "features",
+    '신뢰도': "confidence",
+    'Confidence': "confidence"
+}
+
+_VLM_FIELD_RE = re.compile(
+    r"^[^\S\n]*(" + "|".join(re.escape(label) for label in _VLM_FIELD_KEYS) + r"):(.*)$",
+    re.MULTILINE
+)
+
+
 def extract_place_info_from_vlm_response(vlm_response: str) -> Dict[str, str]:
     info = {
         "place_name": "",
@@ -186,30 +425,20 @@ def extract_place_info_from_vlm_response(vlm_response: str) -> Dict[str, str]:
     }
     
     try:
-        lines = vlm_response.split('\n')
-        for line in lines:
-            line = line.strip()
+        for match in _VLM_FIELD_RE.finditer(vlm_response):
+            key = _VLM_FIELD_KEYS[match.group(1)]
+            value = match.group(2).strip()
             
-            if line.startswith(('장소명:', 'Place Name:')):
-                info["place_name"] = line.split(':', 1)[1].strip()
-            
-            elif line.startswith(('카테고리:', 'Category:')):
-                info["category"] = line.split(':', 1)[1].strip()
-            
-            elif line.startswith(('설명:', 'Description:')):
-                info["description"] = line.split(':', 1)[1].strip()
-            
-            elif line.startswith(('특징:', 'Features:')):
-                info["features"] = line.split(':', 1)[1].strip()
-            
-            elif line.startswith(('신뢰도:', 'Confidence:')):
-                confidence_text = line.split(':', 1)[1].strip().lower()
+            if key == "confidence":
+                confidence_text = value.lower()
                 if 'high' in confidence_text or '높' in confidence_text:
                     info["confidence"] = "high"
                 elif 'medium' in confidence_text or '중' in confidence_text:
                     info["confidence"] = "medium"
                 else:
                     info["confidence"] = "low"
+            else:
+                info[key] = value
     
     except Exception as e:
         logger.warning(f"Failed to extract place info: {e}")
@@ -217,6 +446,9 @@ def extract_place_info_from_vlm_response(vlm_response: str) -> Dict[str, str]:
     return info
 
 
+CONFIDENCE_WEIGHTS = {"high": 0.4, "medium": 0.25, "low": 0.1}
+
+
 def calculate_confidence_score(
     vlm_info: Dict[str, str],
     vector_similarity: Optional[float] = None,
@@ -224,8 +456,7 @@ def calculate_confidence_score(
 ) -> float:
     score = 0.0
     
-    confidence_map = {"high": 0.4, "medium": 0.25, "low": 0.1}
-    score += confidence_map.get(vlm_info.get("confidence", "low"), 0.1)
+    score += CONFIDENCE_WEIGHTS.get(vlm_info.get("confidence", "low"), 0.1)
     
     if vector_similarity is not None:
         score += vector_similarity * 0.4